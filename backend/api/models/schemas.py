@@ -1,7 +1,7 @@
 """Pydantic models for API requests and responses."""
 
 from typing import Optional, List, Dict, Any, Union
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from datetime import datetime
 from enum import Enum
 
@@ -274,6 +274,8 @@ class SettingsData(BaseModel):
 
 class HealthResponse(BaseModel):
     """Health check response."""
+    model_config = ConfigDict(frozen=True)
+
     status: str
     version: str
     timestamp: str
@@ -3,17 +3,19 @@
 import os
 import json
 import time
+import asyncio
+from functools import lru_cache
 from typing import Dict, Any, Tuple, Optional
 from pathlib import Path
 
-from anthropic import Anthropic
+from anthropic import Anthropic, AsyncAnthropic
 
 from configs.constants import (
     DEFAULT_CLAUDE_MODEL, DEFAULT_TIMEOUT_SECONDS, DEFAULT_MAX_RETRIES,
     RATE_LIMIT_BACKOFF_MAX, PROMPT_TOKEN_LIMIT,
 )
 from configs.review_rules import get_review_filtering_section, get_security_filtering_section
-from utils.json_parser import parse_json_with_fallbacks
+from utils.json_parser import JSONObjectStreamDetector, parse_json_with_fallbacks
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -49,6 +51,9 @@ class ClaudeAPIClient:
         
         # Initialize Anthropic client
         self.client = Anthropic(api_key=self.api_key)
+        # Async client is created lazily per event loop (see _get_async_client)
+        self._async_client: Optional[AsyncAnthropic] = None
+        self._async_loop: Optional[asyncio.AbstractEventLoop] = None
         logger.info("Claude API client initialized successfully")
     
     def validate_api_access(self) -> Tuple[bool, str]:
@@ -93,19 +98,8 @@ class ClaudeAPIClient:
             try:
                 logger.info(f"Claude API call attempt {retries + 1}/{self.max_retries + 1}")
                 
-                # Prepare messages
-                messages = [{"role": "user", "content": prompt}]
-                
                 # Build API call parameters
-                api_params = {
-                    "model": self.model,
-                    "max_tokens": max_tokens,
-                    "messages": messages,
-                    "timeout": self.timeout_seconds
-                }
-                
-                if system_prompt:
-                    api_params["system"] = system_prompt
+                api_params = self._build_api_params(prompt, system_prompt, max_tokens)
                 
                 # Make API call
                 start_time = time.time()
@@ -125,24 +119,145 @@ class ClaudeAPIClient:
                 error_msg = str(e)
                 last_error = error_msg
                 logger.error(f"Claude API call failed: {error_msg}")
-                
-                # Check if it's a rate limit error
-                if "rate limit" in error_msg.lower() or "429" in error_msg:
-                    logger.warning("Rate limit detected, increasing backoff")
-                    backoff_time = min(RATE_LIMIT_BACKOFF_MAX, 5 * (retries + 1))  # Progressive backoff
-                    time.sleep(backoff_time)
-                elif "timeout" in error_msg.lower():
-                    logger.warning("Timeout detected, retrying")
-                    time.sleep(2)
-                else:
-                    # For other errors, shorter backoff
-                    time.sleep(1)
-                
+                time.sleep(self._get_retry_backoff(error_msg, retries))
                 retries += 1
         
         # All retries exhausted
         return False, "", f"API call failed after {self.max_retries + 1} attempts: {last_error}"
 
+    async def call_with_retry_async(self,
+                                    prompt: str,
+                                    system_prompt: Optional[str] = None,
+                                    max_tokens: int = PROMPT_TOKEN_LIMIT,
+                                    stop_at_json_end: bool = False) -> Tuple[bool, str, str]:
+        """Async variant of call_with_retry that does not hold a worker thread.
+
+        Args:
+            prompt: User prompt
+            system_prompt: Optional system prompt
+            max_tokens: Maximum tokens to generate
+            stop_at_json_end: Stream the response and stop reading as soon as
+                a complete JSON object has been received
+
+        Returns:
+            Tuple of (success, response_text, error_message)
+        """
+        retries = 0
+        last_error = None
+        client = await self._get_async_client()
+        api_params = self._build_api_params(prompt, system_prompt, max_tokens)
+
+        while retries <= self.max_retries:
+            try:
+                logger.info(f"Claude API call attempt {retries + 1}/{self.max_retries + 1}")
+
+                start_time = time.time()
+                if stop_at_json_end:
+                    response_text = await self._stream_until_json_end_async(client, api_params)
+                else:
+                    response = await client.messages.create(**api_params)
+                    response_text = "".join(
+                        content_block.text for content_block in response.content
+                        if hasattr(content_block, 'text')
+                    )
+                duration = time.time() - start_time
+
+                logger.info(f"Claude API call successful in {duration:.1f}s")
+                return True, response_text, ""
+
+            except Exception as e:
+                error_msg = str(e)
+                last_error = error_msg
+                logger.error(f"Claude API call failed: {error_msg}")
+                await asyncio.sleep(self._get_retry_backoff(error_msg, retries))
+                retries += 1
+
+        # All retries exhausted
+        return False, "", f"API call failed after {self.max_retries + 1} attempts: {last_error}"
+
+    async def _stream_until_json_end_async(self, client: AsyncAnthropic, api_params: Dict[str, Any]) -> str:
+        """Stream a message, closing the stream once a JSON object is complete.
+
+        Args:
+            client: Async client for the running event loop
+            api_params: Parameters for messages.stream
+
+        Returns:
+            Response text received so far
+        """
+        detector = JSONObjectStreamDetector()
+        parts = []
+        async with client.messages.stream(**api_params) as stream:
+            async for text in stream.text_stream:
+                parts.append(text)
+                if detector.feed(text):
+                    break
+        return "".join(parts)
+
+    async def _get_async_client(self) -> AsyncAnthropic:
+        """Get the async client for the running event loop.
+
+        Its connection pool is bound to the loop that created it, so a new
+        client is made if this instance is reused from another loop, and the
+        previous one is closed.
+        """
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_loop is not loop:
+            stale_client, stale_loop = self._async_client, self._async_loop
+            self._async_client = AsyncAnthropic(api_key=self.api_key)
+            self._async_loop = loop
+            if stale_client is not None:
+                await self._close_stale_async_client(stale_client, stale_loop)
+        return self._async_client
+
+    @staticmethod
+    async def _close_stale_async_client(client: AsyncAnthropic, loop: asyncio.AbstractEventLoop) -> None:
+        """Close an async client created on a different event loop (best effort).
+
+        A loop that is still running elsewhere gets the close scheduled on it,
+        since the client's connections belong to that loop.
+        """
+        try:
+            if loop.is_running():
+                asyncio.run_coroutine_threadsafe(client.close(), loop)
+            else:
+                await client.close()
+        except Exception as e:
+            logger.debug(f"Failed to close stale async client: {e}")
+
+    def _build_api_params(self, prompt: str, system_prompt: Optional[str], max_tokens: int) -> Dict[str, Any]:
+        """Build messages.create parameters for a call."""
+        api_params = {
+            "model": self.model,
+            "max_tokens": max_tokens,
+            "messages": [{"role": "user", "content": prompt}],
+            "timeout": self.timeout_seconds
+        }
+        if system_prompt:
+            api_params["system"] = system_prompt
+        return api_params
+
+    @staticmethod
+    def _get_retry_backoff(error_msg: str, retries: int) -> float:
+        """Get the delay before retrying after a failed call.
+
+        Args:
+            error_msg: Error message of the failed attempt
+            retries: Number of attempts that have already failed before this one
+
+        Returns:
+            Backoff time in seconds
+        """
+        # Check if it's a rate limit error
+        if "rate limit" in error_msg.lower() or "429" in error_msg:
+            logger.warning("Rate limit detected, increasing backoff")
+            return min(RATE_LIMIT_BACKOFF_MAX, 5 * (retries + 1))  # Progressive backoff
+        if "timeout" in error_msg.lower():
+            logger.warning("Timeout detected, retrying")
+            return 2
+        # For other errors, shorter backoff
+        return 1
+
     def review_code(self,
                    diff_content: str,
                    pr_context: Optional[Dict[str, Any]] = None,
@@ -509,6 +624,7 @@ Respond with EXACTLY this JSON structure (no markdown, no code blocks):
             return False, "", error_msg
 
 
+@lru_cache(maxsize=8)
 def get_claude_api_client(model: str = DEFAULT_CLAUDE_MODEL,
                          api_key: Optional[str] = None,
                          timeout_seconds: int = DEFAULT_TIMEOUT_SECONDS) -> ClaudeAPIClient:
@@ -520,7 +636,8 @@ def get_claude_api_client(model: str = DEFAULT_CLAUDE_MODEL,
         timeout_seconds: API call timeout
         
     Returns:
-        Initialized ClaudeAPIClient instance
+        Initialized ClaudeAPIClient instance, shared between calls with the
+        same arguments so its HTTP connection pool is reused
     """
     return ClaudeAPIClient(
         model=model,
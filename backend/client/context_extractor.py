@@ -74,11 +74,13 @@ class ExtractedContext:
     # These are high-priority for cross-file analysis
     diff_imported_files: List[FileContext] = field(default_factory=list)
 
-    def to_prompt_section(self, max_total_size: int = 40000) -> str:
+    def to_prompt_section(self, max_total_size: int = 40000, tree_string: Optional[str] = None) -> str:
         """Convert context to prompt section for LLM with size limits.
 
         Args:
             max_total_size: Maximum total size of the prompt section
+            tree_string: Repository tree already rendered by the caller
+                (depth 3, capped at 2000 chars); rendered here if None
 
         Returns:
             Formatted prompt section string
@@ -89,7 +91,9 @@ class ExtractedContext:
         # Repository structure (small, always include)
         if self.repo_structure:
             struct_section = "## Repository Structure\n```\n"
-            struct_section += self.repo_structure.to_tree_string(max_depth=3)[:2000]
+            if tree_string is None:
+                tree_string = self.repo_structure.to_tree_string(max_depth=3)[:2000]
+            struct_section += tree_string
             struct_section += "\n```\n"
             struct_section += f"Languages: {', '.join(self.repo_structure.languages[:10])}\n"
             sections.append(struct_section)
@@ -116,7 +120,7 @@ class ExtractedContext:
             for f in self.changed_files[:max_files]:
                 # Calculate per-file limit
                 file_limit = min(per_file_budget, 10000)
-                content = f.content[:file_limit] if len(f.content) > file_limit else f.content
+                content = f.content[:file_limit]
 
                 file_section = f"### {f.path}\n```{f.language}\n{content}\n```\n"
 
@@ -150,7 +154,7 @@ class ExtractedContext:
             per_file_limit = min(diff_imported_budget // max(max_diff_imported, 1), 8000)
 
             for f in self.diff_imported_files[:max_diff_imported]:
-                content = f.content[:per_file_limit] if len(f.content) > per_file_limit else f.content
+                content = f.content[:per_file_limit]
                 file_section = f"### {f.path}\n```{f.language}\n{content}\n```\n"
 
                 if current_size + len(file_section) > max_total_size - related_budget:
@@ -171,7 +175,7 @@ class ExtractedContext:
             per_file_limit = min(remaining_budget // max(max_related, 1), 5000)
 
             for f in self.related_files[:max_related]:
-                content = f.content[:per_file_limit] if len(f.content) > per_file_limit else f.content
+                content = f.content[:per_file_limit]
                 file_section = f"### {f.path}\n```{f.language}\n{content}\n```\n"
 
                 if current_size + len(file_section) > max_total_size:
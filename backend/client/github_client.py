@@ -7,6 +7,7 @@ import os
 import re
 import base64
 import time
+from functools import lru_cache
 from typing import Dict, Any, List, Optional, Tuple
 
 import requests
@@ -80,7 +81,8 @@ class GitHubClient:
             allowed_methods=["HEAD", "GET", "POST", "PUT", "DELETE", "OPTIONS", "TRACE"],
             raise_on_status=False
         )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        # Pool sized for the concurrent PR detail/files/diff and content fetches
+        adapter = HTTPAdapter(max_retries=retry_strategy, pool_connections=20, pool_maxsize=20)
         self.session.mount("https://", adapter)
         self.session.mount("http://", adapter)
         self.session.headers.update(self.headers)
@@ -585,6 +587,33 @@ class GitHubClient:
         # Get complete diff
         diff = self.get_pull_request_diff(owner, repo, pr_number, apply_filters)
 
+        return self.build_pr_review_data(owner, repo, pr_number, pr_info, files, diff)
+
+    def build_pr_review_data(
+        self,
+        owner: str,
+        repo: str,
+        pr_number: int,
+        pr_info: Dict[str, Any],
+        files: List[Dict[str, Any]],
+        diff: str
+    ) -> Dict[str, Any]:
+        """Assemble PR review data from separately fetched parts.
+
+        Lets callers fetch PR details, files and diff concurrently and
+        still produce the same structure as get_pr_review_data.
+
+        Args:
+            owner: Repository owner
+            repo: Repository name
+            pr_number: Pull request number
+            pr_info: Result of get_pull_request
+            files: Result of get_pull_request_files
+            diff: Result of get_pull_request_diff
+
+        Returns:
+            Dictionary with complete PR review data
+        """
         return {
             'pr': pr_info,
             'files': files,
@@ -807,11 +836,26 @@ def get_github_client(
         filter_generated: Whether to filter generated files
 
     Returns:
-        Initialized GitHubClient instance
+        Initialized GitHubClient instance, shared between calls with the
+        same arguments so its HTTP connection pool is reused
     """
+    return _get_cached_github_client(
+        token,
+        tuple(excluded_dirs) if excluded_dirs is not None else None,
+        filter_generated
+    )
+
+
+@lru_cache(maxsize=8)
+def _get_cached_github_client(
+    token: Optional[str],
+    excluded_dirs: Optional[Tuple[str, ...]],
+    filter_generated: bool
+) -> GitHubClient:
+    """Create a GitHubClient once per distinct argument set."""
     return GitHubClient(
         token=token,
-        excluded_dirs=excluded_dirs,
+        excluded_dirs=list(excluded_dirs) if excluded_dirs is not None else None,
         filter_generated=filter_generated
     )
 
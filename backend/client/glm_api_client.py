@@ -2,16 +2,18 @@
 
 import os
 import time
-from typing import Dict, Any, Tuple, Optional
+import asyncio
+from functools import lru_cache
+from typing import Dict, Any, List, Tuple, Optional
 
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
 
 from configs.constants import (
     DEFAULT_GLM_MODEL, DEFAULT_TIMEOUT_SECONDS, DEFAULT_MAX_RETRIES,
     RATE_LIMIT_BACKOFF_MAX, PROMPT_TOKEN_LIMIT, GLM_API_BASE_URL,
 )
 from configs.review_rules import get_review_filtering_section
-from utils.json_parser import parse_json_with_fallbacks
+from utils.json_parser import JSONObjectStreamDetector, parse_json_with_fallbacks
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -53,6 +55,9 @@ class GLMAPIClient:
             api_key=self.api_key,
             base_url=self.base_url
         )
+        # Async client is created lazily per event loop (see _get_async_client)
+        self._async_client: Optional[AsyncOpenAI] = None
+        self._async_loop: Optional[asyncio.AbstractEventLoop] = None
         logger.info(f"GLM API client initialized successfully with model: {self.model}")
 
     def validate_api_access(self) -> Tuple[bool, str]:
@@ -98,10 +103,7 @@ class GLMAPIClient:
                 logger.info(f"GLM API call attempt {retries + 1}/{self.max_retries + 1}")
 
                 # Prepare messages
-                messages = []
-                if system_prompt:
-                    messages.append({"role": "system", "content": system_prompt})
-                messages.append({"role": "user", "content": prompt})
+                messages = self._build_messages(prompt, system_prompt)
 
                 # Make API call
                 start_time = time.time()
@@ -123,24 +125,162 @@ class GLMAPIClient:
                 error_msg = str(e)
                 last_error = error_msg
                 logger.error(f"GLM API call failed: {error_msg}")
+                time.sleep(self._get_retry_backoff(error_msg, retries))
+                retries += 1
+
+        # All retries exhausted
+        return False, "", f"API call failed after {self.max_retries + 1} attempts: {last_error}"
 
-                # Check if it's a rate limit error
-                if "rate limit" in error_msg.lower() or "429" in error_msg:
-                    logger.warning("Rate limit detected, increasing backoff")
-                    backoff_time = min(RATE_LIMIT_BACKOFF_MAX, 5 * (retries + 1))
-                    time.sleep(backoff_time)
-                elif "timeout" in error_msg.lower():
-                    logger.warning("Timeout detected, retrying")
-                    time.sleep(2)
+    async def call_with_retry_async(self,
+                                    prompt: str,
+                                    system_prompt: Optional[str] = None,
+                                    max_tokens: int = PROMPT_TOKEN_LIMIT,
+                                    stop_at_json_end: bool = False) -> Tuple[bool, str, str]:
+        """Async variant of call_with_retry that does not hold a worker thread.
+
+        Args:
+            prompt: User prompt
+            system_prompt: Optional system prompt
+            max_tokens: Maximum tokens to generate
+            stop_at_json_end: Stream the response and stop reading as soon as
+                a complete JSON object has been received
+
+        Returns:
+            Tuple of (success, response_text, error_message)
+        """
+        retries = 0
+        last_error = None
+        client = await self._get_async_client()
+        messages = self._build_messages(prompt, system_prompt)
+
+        while retries <= self.max_retries:
+            try:
+                logger.info(f"GLM API call attempt {retries + 1}/{self.max_retries + 1}")
+
+                start_time = time.time()
+                if stop_at_json_end:
+                    response_text = await self._stream_until_json_end_async(client, messages, max_tokens)
                 else:
-                    # For other errors, shorter backoff
-                    time.sleep(1)
+                    response = await client.chat.completions.create(
+                        model=self.model,
+                        max_tokens=max_tokens,
+                        messages=messages,
+                        timeout=self.timeout_seconds
+                    )
+                    response_text = response.choices[0].message.content or ""
+                duration = time.time() - start_time
+
+                logger.info(f"GLM API call successful in {duration:.1f}s")
+                return True, response_text, ""
 
+            except Exception as e:
+                error_msg = str(e)
+                last_error = error_msg
+                logger.error(f"GLM API call failed: {error_msg}")
+                await asyncio.sleep(self._get_retry_backoff(error_msg, retries))
                 retries += 1
 
         # All retries exhausted
         return False, "", f"API call failed after {self.max_retries + 1} attempts: {last_error}"
 
+    async def _stream_until_json_end_async(self,
+                                           client: AsyncOpenAI,
+                                           messages: List[Dict[str, str]],
+                                           max_tokens: int) -> str:
+        """Stream a completion, closing the stream once a JSON object is complete.
+
+        Args:
+            client: Async client for the running event loop
+            messages: Chat messages
+            max_tokens: Maximum tokens to generate
+
+        Returns:
+            Response text received so far
+        """
+        detector = JSONObjectStreamDetector()
+        parts = []
+        stream = await client.chat.completions.create(
+            model=self.model,
+            max_tokens=max_tokens,
+            messages=messages,
+            timeout=self.timeout_seconds,
+            stream=True
+        )
+        try:
+            async for chunk in stream:
+                if not chunk.choices:
+                    continue
+                text = chunk.choices[0].delta.content or ""
+                if not text:
+                    continue
+                parts.append(text)
+                if detector.feed(text):
+                    break
+        finally:
+            await stream.close()
+        return "".join(parts)
+
+    async def _get_async_client(self) -> AsyncOpenAI:
+        """Get the async client for the running event loop.
+
+        Its connection pool is bound to the loop that created it, so a new
+        client is made if this instance is reused from another loop, and the
+        previous one is closed.
+        """
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_loop is not loop:
+            stale_client, stale_loop = self._async_client, self._async_loop
+            self._async_client = AsyncOpenAI(api_key=self.api_key, base_url=self.base_url)
+            self._async_loop = loop
+            if stale_client is not None:
+                await self._close_stale_async_client(stale_client, stale_loop)
+        return self._async_client
+
+    @staticmethod
+    async def _close_stale_async_client(client: AsyncOpenAI, loop: asyncio.AbstractEventLoop) -> None:
+        """Close an async client created on a different event loop (best effort).
+
+        A loop that is still running elsewhere gets the close scheduled on it,
+        since the client's connections belong to that loop.
+        """
+        try:
+            if loop.is_running():
+                asyncio.run_coroutine_threadsafe(client.close(), loop)
+            else:
+                await client.close()
+        except Exception as e:
+            logger.debug(f"Failed to close stale async client: {e}")
+
+    @staticmethod
+    def _build_messages(prompt: str, system_prompt: Optional[str]) -> List[Dict[str, str]]:
+        """Build the chat message list for a call."""
+        messages = []
+        if system_prompt:
+            messages.append({"role": "system", "content": system_prompt})
+        messages.append({"role": "user", "content": prompt})
+        return messages
+
+    @staticmethod
+    def _get_retry_backoff(error_msg: str, retries: int) -> float:
+        """Get the delay before retrying after a failed call.
+
+        Args:
+            error_msg: Error message of the failed attempt
+            retries: Number of attempts that have already failed before this one
+
+        Returns:
+            Backoff time in seconds
+        """
+        # Check if it's a rate limit error
+        if "rate limit" in error_msg.lower() or "429" in error_msg:
+            logger.warning("Rate limit detected, increasing backoff")
+            return min(RATE_LIMIT_BACKOFF_MAX, 5 * (retries + 1))
+        if "timeout" in error_msg.lower():
+            logger.warning("Timeout detected, retrying")
+            return 2
+        # For other errors, shorter backoff
+        return 1
+
     def review_code(self,
                    diff_content: str,
                    pr_context: Optional[Dict[str, Any]] = None,
@@ -336,6 +476,7 @@ IMPORTANT NOTES:
 Respond with ONLY the JSON object, no additional text or markdown formatting."""
 
 
+@lru_cache(maxsize=8)
 def get_glm_api_client(model: str = DEFAULT_GLM_MODEL,
                        api_key: Optional[str] = None,
                        base_url: Optional[str] = None,
@@ -349,7 +490,8 @@ def get_glm_api_client(model: str = DEFAULT_GLM_MODEL,
         timeout_seconds: API call timeout
 
     Returns:
-        Initialized GLMAPIClient instance
+        Initialized GLMAPIClient instance, shared between calls with the
+        same arguments so its HTTP connection pool is reused
     """
     return GLMAPIClient(
         model=model,
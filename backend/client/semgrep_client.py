@@ -5,10 +5,14 @@ import subprocess
 import tempfile
 import os
 import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, List, Dict, Any, Tuple
 from dataclasses import dataclass, asdict
 
+import orjson
+
+from utils.content_cache import ContentCache, content_hash
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -85,6 +89,8 @@ class SemgrepClient:
         self.rulesets = rulesets or self.DEFAULT_RULESETS
         self.timeout = timeout
         self.use_custom_rules = use_custom_rules
+        self._version = ""
+        self._findings_cache = ContentCache("semgrep")
         self._check_semgrep_installed()
 
     def _check_semgrep_installed(self) -> bool:
@@ -97,7 +103,8 @@ class SemgrepClient:
                 timeout=10
             )
             if result.returncode == 0:
-                logger.info(f"Semgrep version: {result.stdout.strip()}")
+                self._version = result.stdout.strip()
+                logger.info(f"Semgrep version: {self._version}")
                 return True
         except FileNotFoundError:
             logger.warning("Semgrep not installed. Install with: pip install semgrep")
@@ -160,6 +167,53 @@ class SemgrepClient:
 
         return list(rulesets)
 
+    def _get_custom_rule_files(self) -> List[Path]:
+        """Get custom rule files if enabled and present."""
+        if not (self.use_custom_rules and self.CUSTOM_RULES_PATH.exists()):
+            return []
+        return list(self.CUSTOM_RULES_PATH.glob("*.yaml")) + list(self.CUSTOM_RULES_PATH.glob("*.yml"))
+
+    def _rules_fingerprint(self, rulesets: List[str], custom_rule_files: List[Path]) -> str:
+        """Identify the rule configuration so cached findings are not reused across rule changes.
+
+        Args:
+            rulesets: Rulesets passed to Semgrep
+            custom_rule_files: Custom rule files passed to Semgrep
+
+        Returns:
+            Hash of Semgrep version, rulesets and custom rule contents
+        """
+        parts = [self._version, str(self.timeout), *sorted(rulesets)]
+        for rule_file in sorted(custom_rule_files):
+            try:
+                parts.append(f"{rule_file.name}:{rule_file.read_text()}")
+            except OSError:
+                parts.append(rule_file.name)
+        return content_hash(*parts)
+
+    def _cache_findings(
+        self,
+        findings: List[SastFinding],
+        scanned_keys: Dict[str, str]
+    ) -> None:
+        """Store findings per scanned file (including files with none).
+
+        Nothing is cached if any finding cannot be mapped back to a scanned
+        file, since that file would otherwise be cached as having no findings.
+
+        Args:
+            findings: Findings from this Semgrep run, with repo-relative paths
+            scanned_keys: Dict of {filename: cache key} for files sent to Semgrep
+        """
+        by_file: Dict[str, List[Dict[str, Any]]] = {filename: [] for filename in scanned_keys}
+        for finding in findings:
+            if finding.file not in by_file:
+                logger.warning(f"Not caching Semgrep results: unmatched finding path {finding.file}")
+                return
+            by_file[finding.file].append(finding.to_dict())
+        for filename, file_findings in by_file.items():
+            self._findings_cache.put(scanned_keys[filename], file_findings)
+
     def _categorize_finding(self, rule_id: str, message: str) -> str:
         """Categorize a finding based on rule ID and message.
 
@@ -335,9 +389,20 @@ class SemgrepClient:
         rulesets = self._get_rulesets_for_languages(languages)
         logger.info(f"Detected languages: {languages}, using rulesets: {rulesets}")
 
+        custom_rule_files = self._get_custom_rule_files()
+        rules_fingerprint = self._rules_fingerprint(rulesets, custom_rule_files)
+
+        # Findings reused from earlier runs on identical file content
+        cached_findings: List[SastFinding] = []
+        cache_hits = 0
+        # {filename: cache key} for files that actually need scanning
+        scanned_keys: Dict[str, str] = {}
+
         # Create temporary directory with the changed files
         with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
+            # Resolved so the prefix matches Semgrep's paths when the temp
+            # dir is behind a symlink (e.g. /var -> /private/var on macOS)
+            temp_path = Path(temp_dir).resolve()
 
             # Extract and write files
             files_created = 0
@@ -362,6 +427,14 @@ class SemgrepClient:
                 if not file_content:
                     continue
 
+                # Skip files whose findings are cached for this content and rule set
+                cache_key = content_hash(rules_fingerprint, filename, file_content)
+                cached = self._findings_cache.get(cache_key)
+                if cached is not None:
+                    cached_findings.extend(SastFinding(**d) for d in cached)
+                    cache_hits += 1
+                    continue
+
                 # Create the file in temp directory
                 file_path = temp_path / filename
                 file_path.parent.mkdir(parents=True, exist_ok=True)
@@ -369,13 +442,20 @@ class SemgrepClient:
                 try:
                     file_path.write_text(file_content)
                     files_created += 1
+                    scanned_keys[filename] = cache_key
                 except Exception as e:
                     logger.warning(f"Error writing temp file {filename}: {e}")
 
             if files_created == 0:
+                if cache_hits:
+                    logger.info(f"All {cache_hits} files served from SAST cache ({len(cached_findings)} findings)")
+                    return True, cached_findings, None
                 logger.info("No files extracted from patches for SAST analysis")
                 return True, [], None
 
+            if cache_hits:
+                logger.info(f"Reusing cached SAST results for {cache_hits} unchanged files")
+
             logger.info(f"Created {files_created} temp files for SAST analysis")
 
             # Build Semgrep command
@@ -392,13 +472,11 @@ class SemgrepClient:
                 cmd.extend(["--config", ruleset])
 
             # Add custom rules if enabled and directory exists
-            if self.use_custom_rules and self.CUSTOM_RULES_PATH.exists():
-                custom_rule_files = list(self.CUSTOM_RULES_PATH.glob("*.yaml")) + list(self.CUSTOM_RULES_PATH.glob("*.yml"))
-                for rule_file in custom_rule_files:
-                    cmd.extend(["--config", str(rule_file)])
-                    logger.debug(f"Added custom rule file: {rule_file.name}")
-                if custom_rule_files:
-                    logger.info(f"Using {len(custom_rule_files)} custom rule file(s)")
+            for rule_file in custom_rule_files:
+                cmd.extend(["--config", str(rule_file)])
+                logger.debug(f"Added custom rule file: {rule_file.name}")
+            if custom_rule_files:
+                logger.info(f"Using {len(custom_rule_files)} custom rule file(s)")
 
             # Add target directory
             cmd.append(str(temp_path))
@@ -416,7 +494,8 @@ class SemgrepClient:
                 # Parse output
                 if result.stdout:
                     try:
-                        output = json.loads(result.stdout)
+                        # orjson.JSONDecodeError subclasses json.JSONDecodeError
+                        output = orjson.loads(result.stdout)
                         findings = self._parse_semgrep_output(output, diff_content)
 
                         # Adjust file paths (remove temp dir prefix)
@@ -425,7 +504,12 @@ class SemgrepClient:
                                 finding.file = finding.file[len(str(temp_path)) + 1:]
 
                         logger.info(f"Semgrep found {len(findings)} issues")
-                        return True, findings, None
+
+                        # Only cache complete runs; Semgrep errors may hide per-file findings
+                        if not output.get("errors"):
+                            self._cache_findings(findings, scanned_keys)
+
+                        return True, cached_findings + findings, None
 
                     except json.JSONDecodeError as e:
                         logger.error(f"Failed to parse Semgrep JSON output: {e}")
@@ -434,7 +518,7 @@ class SemgrepClient:
                 # No output usually means no findings
                 if result.returncode == 0:
                     logger.info("Semgrep completed with no findings")
-                    return True, [], None
+                    return True, cached_findings, None
 
                 # Check for errors
                 if result.stderr:
@@ -444,7 +528,7 @@ class SemgrepClient:
                     if "error" in error_msg.lower():
                         return False, [], f"Semgrep error: {error_msg}"
 
-                return True, [], None
+                return True, cached_findings, None
 
             except subprocess.TimeoutExpired:
                 logger.error(f"Semgrep timed out after {self.timeout}s")
@@ -576,6 +660,13 @@ def get_semgrep_client(
         timeout: Analysis timeout in seconds
 
     Returns:
-        SemgrepClient instance
+        SemgrepClient instance, shared between calls with the same arguments
+        so the installation check runs once
     """
-    return SemgrepClient(rulesets=rulesets, timeout=timeout)
+    return _get_cached_semgrep_client(tuple(rulesets) if rulesets else None, timeout)
+
+
+@lru_cache(maxsize=8)
+def _get_cached_semgrep_client(rulesets: Optional[Tuple[str, ...]], timeout: int) -> SemgrepClient:
+    """Create a SemgrepClient once per distinct argument set."""
+    return SemgrepClient(rulesets=list(rulesets) if rulesets else None, timeout=timeout)
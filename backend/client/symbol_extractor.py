@@ -7,10 +7,14 @@ Supports multiple languages through tree-sitter grammars.
 """
 
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, List, Dict, Any, Set
 from dataclasses import dataclass, field, asdict
 
+from utils.content_cache import ContentCache, content_hash
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -61,6 +65,17 @@ class FileSymbols:
             'errors': self.errors,
         }
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'FileSymbols':
+        """Rebuild from the output of to_dict."""
+        return cls(
+            file_path=data['file_path'],
+            language=data['language'],
+            symbols=[SymbolInfo(**s) for s in data.get('symbols', [])],
+            imports=data.get('imports', []),
+            errors=data.get('errors', []),
+        )
+
     def get_exported_names(self) -> Set[str]:
         """Get all exported symbol names."""
         return {s.name for s in self.symbols if s.exported}
@@ -69,6 +84,9 @@ class FileSymbols:
 class SymbolExtractor:
     """Extract symbols from source files using tree-sitter."""
 
+    # Bump when extraction logic changes to invalidate cached symbol tables
+    CACHE_VERSION = "1"
+
     # Language detection by extension
     EXTENSION_MAP = {
         '.py': 'python',
@@ -83,53 +101,53 @@ class SymbolExtractor:
 
     def __init__(self):
         """Initialize the symbol extractor."""
-        self._parsers: Dict[str, Parser] = {}
+        self._languages: Dict[str, Language] = {}
+        self._local = threading.local()  # Parsers are not thread-safe; one set per thread
         self._available = TREE_SITTER_AVAILABLE
+        self._symbols_cache = ContentCache("symbols")
 
         if self._available:
             self._init_parsers()
 
     def _init_parsers(self):
-        """Initialize tree-sitter parsers for each language."""
+        """Load tree-sitter grammars for each language."""
         try:
             # Python
-            self._parsers['python'] = Parser(Language(tree_sitter_python.language()))
+            self._languages['python'] = Language(tree_sitter_python.language())
             logger.debug("Initialized Python parser")
         except Exception as e:
             logger.warning(f"Failed to init Python parser: {e}")
 
         try:
             # JavaScript
-            self._parsers['javascript'] = Parser(Language(tree_sitter_javascript.language()))
+            self._languages['javascript'] = Language(tree_sitter_javascript.language())
             logger.debug("Initialized JavaScript parser")
         except Exception as e:
             logger.warning(f"Failed to init JavaScript parser: {e}")
 
         try:
             # TypeScript
-            ts_lang = Language(tree_sitter_typescript.language_typescript())
-            self._parsers['typescript'] = Parser(ts_lang)
-            tsx_lang = Language(tree_sitter_typescript.language_tsx())
-            self._parsers['tsx'] = Parser(tsx_lang)
+            self._languages['typescript'] = Language(tree_sitter_typescript.language_typescript())
+            self._languages['tsx'] = Language(tree_sitter_typescript.language_tsx())
             logger.debug("Initialized TypeScript parser")
         except Exception as e:
             logger.warning(f"Failed to init TypeScript parser: {e}")
 
         try:
             # Go
-            self._parsers['go'] = Parser(Language(tree_sitter_go.language()))
+            self._languages['go'] = Language(tree_sitter_go.language())
             logger.debug("Initialized Go parser")
         except Exception as e:
             logger.warning(f"Failed to init Go parser: {e}")
 
         try:
             # Java
-            self._parsers['java'] = Parser(Language(tree_sitter_java.language()))
+            self._languages['java'] = Language(tree_sitter_java.language())
             logger.debug("Initialized Java parser")
         except Exception as e:
             logger.warning(f"Failed to init Java parser: {e}")
 
-        logger.info(f"Symbol extractor initialized with parsers: {list(self._parsers.keys())}")
+        logger.info(f"Symbol extractor initialized with parsers: {list(self._languages.keys())}")
 
     def _detect_language(self, filename: str) -> Optional[str]:
         """Detect language from filename."""
@@ -141,8 +159,18 @@ class SymbolExtractor:
         return lang
 
     def _get_parser(self, language: str) -> Optional[Parser]:
-        """Get parser for a language."""
-        return self._parsers.get(language)
+        """Get the calling thread's parser for a language."""
+        ts_language = self._languages.get(language)
+        if ts_language is None:
+            return None
+
+        parsers = getattr(self._local, 'parsers', None)
+        if parsers is None:
+            parsers = self._local.parsers = {}
+        parser = parsers.get(language)
+        if parser is None:
+            parser = parsers[language] = Parser(ts_language)
+        return parser
 
     def extract_symbols(self, filename: str, content: str) -> FileSymbols:
         """Extract symbols from a single file.
@@ -653,11 +681,9 @@ class SymbolExtractor:
         Returns:
             Dict of {filepath: FileSymbols}
         """
-        results = {}
-        processed = 0
-
+        selected = []
         for filepath, content in files.items():
-            if processed >= max_files:
+            if len(selected) >= max_files:
                 logger.debug(f"Reached max files limit ({max_files}), skipping remaining")
                 break
 
@@ -666,10 +692,28 @@ class SymbolExtractor:
                 logger.debug(f"Skipping {filepath}: too large ({len(content)} chars)")
                 continue
 
-            results[filepath] = self.extract_symbols(filepath, content)
-            processed += 1
+            selected.append((filepath, content))
+
+        if len(selected) <= 1:
+            return {filepath: self._extract_cached(filepath, content) for filepath, content in selected}
+
+        # Files are independent; parse them concurrently
+        max_workers = min(len(selected), os.cpu_count() or 1, 8)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            extracted = executor.map(lambda item: self._extract_cached(*item), selected)
+            return {filepath: file_symbols for (filepath, _), file_symbols in zip(selected, extracted)}
+
+    def _extract_cached(self, filepath: str, content: str) -> FileSymbols:
+        """Extract symbols for one file, reusing results for identical content."""
+        cache_key = content_hash(self.CACHE_VERSION, filepath, content)
+        cached = self._symbols_cache.get(cache_key)
+        if cached is not None:
+            return FileSymbols.from_dict(cached)
 
-        return results
+        file_symbols = self.extract_symbols(filepath, content)
+        if self._available and not file_symbols.errors:
+            self._symbols_cache.put(cache_key, file_symbols.to_dict())
+        return file_symbols
 
     def format_for_prompt(
         self,
@@ -750,6 +794,7 @@ class SymbolExtractor:
         return self._available
 
 
+@lru_cache(maxsize=1)
 def get_symbol_extractor() -> SymbolExtractor:
-    """Get a SymbolExtractor instance."""
+    """Get the shared SymbolExtractor instance."""
     return SymbolExtractor()
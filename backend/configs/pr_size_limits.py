@@ -3,6 +3,8 @@
 Controls how large PRs are handled to prevent token overflow and timeout issues.
 """
 
+import io
+import re
 from dataclasses import dataclass
 from typing import Optional
 
@@ -45,6 +47,13 @@ class PRSizeLimits:
 # Default limits instance
 DEFAULT_LIMITS = PRSizeLimits()
 
+# Frequently-read thresholds hoisted for the size-check properties below
+_MAX_FILES_FULL = DEFAULT_LIMITS.max_files_for_full_analysis
+_MAX_FILES_CONTENT = DEFAULT_LIMITS.max_files_for_file_content
+_MAX_FILES_ABSOLUTE = DEFAULT_LIMITS.max_files_absolute
+_MAX_LINES_CHANGED = DEFAULT_LIMITS.max_lines_changed
+_MAX_DIFF_SIZE = DEFAULT_LIMITS.max_diff_size
+
 
 @dataclass
 class PRSizeMetrics:
@@ -61,18 +70,18 @@ class PRSizeMetrics:
     def is_large(self) -> bool:
         """Check if PR is considered large."""
         return (
-            self.file_count > DEFAULT_LIMITS.max_files_for_full_analysis or
-            self.total_changes > DEFAULT_LIMITS.max_lines_changed or
-            self.diff_size_chars > DEFAULT_LIMITS.max_diff_size
+            self.file_count > _MAX_FILES_FULL or
+            self.total_changes > _MAX_LINES_CHANGED or
+            self.diff_size_chars > _MAX_DIFF_SIZE
         )
 
     @property
     def is_very_large(self) -> bool:
         """Check if PR is very large (needs heavy truncation)."""
         return (
-            self.file_count > DEFAULT_LIMITS.max_files_absolute or
-            self.total_changes > DEFAULT_LIMITS.max_lines_changed * 2 or
-            self.diff_size_chars > DEFAULT_LIMITS.max_diff_size * 2
+            self.file_count > _MAX_FILES_ABSOLUTE or
+            self.total_changes > _MAX_LINES_CHANGED * 2 or
+            self.diff_size_chars > _MAX_DIFF_SIZE * 2
         )
 
     @property
@@ -82,7 +91,7 @@ class PRSizeMetrics:
         When True, only use diff for analysis - skip fetching full file contents.
         This significantly reduces API calls and processing time for large PRs.
         """
-        return self.file_count > DEFAULT_LIMITS.max_files_for_file_content
+        return self.file_count > _MAX_FILES_CONTENT
 
     def get_recommended_mode(self) -> str:
         """Get recommended processing mode based on PR size.
@@ -120,17 +129,22 @@ def calculate_pr_metrics(
     metrics.file_count = len(files)
     metrics.diff_size_chars = len(diff_content)
 
+    # Accumulate in locals; attribute writes per file dominate for large PRs
+    total_additions = 0
+    total_deletions = 0
+    largest_file_lines = 0
     for f in files:
         additions = f.get('additions', 0)
         deletions = f.get('deletions', 0)
-        metrics.total_additions += additions
-        metrics.total_deletions += deletions
-        metrics.largest_file_lines = max(
-            metrics.largest_file_lines,
-            additions + deletions
-        )
+        total_additions += additions
+        total_deletions += deletions
+        if additions + deletions > largest_file_lines:
+            largest_file_lines = additions + deletions
 
-    metrics.total_changes = metrics.total_additions + metrics.total_deletions
+    metrics.total_additions = total_additions
+    metrics.total_deletions = total_deletions
+    metrics.largest_file_lines = largest_file_lines
+    metrics.total_changes = total_additions + total_deletions
 
     # Rough token estimate (1 token ≈ 4 chars for code)
     metrics.estimated_tokens = metrics.diff_size_chars // 4
@@ -162,6 +176,18 @@ def truncate_content(content: str, max_size: int, suffix: str = "\n... [truncate
     return content[:truncate_at] + suffix
 
 
+# File type priorities (higher = more important)
+_TYPE_PRIORITY = {
+    '.py': 10, '.go': 10, '.java': 10, '.ts': 10, '.tsx': 10,
+    '.js': 9, '.jsx': 9, '.rs': 10, '.rb': 9, '.php': 9,
+    '.c': 8, '.cpp': 8, '.h': 8, '.hpp': 8, '.cs': 9,
+    '.sql': 7, '.graphql': 7,
+    '.yaml': 5, '.yml': 5, '.json': 4, '.toml': 4,
+    '.md': 2, '.txt': 1, '.rst': 2,
+    '.css': 3, '.scss': 3, '.html': 3,
+}
+
+
 def prioritize_files(files: list, max_files: int) -> list:
     """Prioritize files for analysis when there are too many.
 
@@ -180,27 +206,14 @@ def prioritize_files(files: list, max_files: int) -> list:
     if len(files) <= max_files:
         return files
 
-    # File type priorities (higher = more important)
-    type_priority = {
-        '.py': 10, '.go': 10, '.java': 10, '.ts': 10, '.tsx': 10,
-        '.js': 9, '.jsx': 9, '.rs': 10, '.rb': 9, '.php': 9,
-        '.c': 8, '.cpp': 8, '.h': 8, '.hpp': 8, '.cs': 9,
-        '.sql': 7, '.graphql': 7,
-        '.yaml': 5, '.yml': 5, '.json': 4, '.toml': 4,
-        '.md': 2, '.txt': 1, '.rst': 2,
-        '.css': 3, '.scss': 3, '.html': 3,
-    }
-
     def get_priority(f):
         filename = f.get('filename', '')
         changes = f.get('additions', 0) + f.get('deletions', 0)
 
-        # Get extension priority
-        ext_priority = 0
-        for ext, priority in type_priority.items():
-            if filename.endswith(ext):
-                ext_priority = priority
-                break
+        # Get extension priority (no listed extension is a suffix of another,
+        # so an exact lookup on the final extension matches endswith())
+        dot = filename.rfind('.')
+        ext_priority = _TYPE_PRIORITY.get(filename[dot:], 0) if dot != -1 else 0
 
         # Combine: type priority * 1000 + changes (capped at 500)
         return ext_priority * 1000 + min(changes, 500)
@@ -209,6 +222,45 @@ def prioritize_files(files: list, max_files: int) -> list:
     return sorted_files[:max_files]
 
 
+# "diff --git a/<path> b/<path>" header; git quotes paths with special characters
+_DIFF_HEADER_RE = re.compile(r'^diff --git "?a/(?P<a>.*) "?b/(?P<b>.*?)"?$')
+
+
+# Start of each per-file section; git emits one header line per file
+_DIFF_SECTION_RE = re.compile(r'^diff --git', re.MULTILINE)
+
+
+def _split_file_diffs(diff_content: str) -> list:
+    """Split a unified diff into (filename, section) pairs.
+
+    Section boundaries are located with a single regex scan and sliced out
+    directly, instead of splitting the diff into lines and re-joining them.
+    Any preamble before the first header is dropped.
+
+    Args:
+        diff_content: Full diff content
+
+    Returns:
+        List of (filename, content) tuples in diff order
+    """
+    starts = [m.start() for m in _DIFF_SECTION_RE.finditer(diff_content)]
+    file_diffs = []
+
+    for i, start in enumerate(starts):
+        # Each section ends just before the newline preceding the next header
+        end = starts[i + 1] - 1 if i + 1 < len(starts) else len(diff_content)
+        header_end = diff_content.find('\n', start, end)
+        header = diff_content[start:header_end if header_end != -1 else end]
+
+        # Extract filename from diff header
+        m = _DIFF_HEADER_RE.match(header)
+        filename = m.group('b') if m else header
+        if filename:
+            file_diffs.append((filename, diff_content[start:end]))
+
+    return file_diffs
+
+
 def smart_diff_truncate(diff_content: str, max_size: int, files: list) -> str:
     """Intelligently truncate diff content, keeping important files.
 
@@ -227,54 +279,44 @@ def smart_diff_truncate(diff_content: str, max_size: int, files: list) -> str:
     priority_files = prioritize_files(files, 20)
     priority_names = {f.get('filename', '') for f in priority_files}
 
-    # Split diff by file
-    file_diffs = []
-    current_file = None
-    current_content = []
-
-    for line in diff_content.split('\n'):
-        if line.startswith('diff --git'):
-            if current_file:
-                file_diffs.append((current_file, '\n'.join(current_content)))
-            # Extract filename from diff header
-            parts = line.split(' b/')
-            current_file = parts[-1] if len(parts) > 1 else line
-            current_content = [line]
-        else:
-            current_content.append(line)
-
-    if current_file:
-        file_diffs.append((current_file, '\n'.join(current_content)))
+    file_diffs = _split_file_diffs(diff_content)
 
     # Sort by priority
     def file_priority(item):
         filename, content = item
-        if filename in priority_names:
-            return (1, -len(content))  # Priority files first, shorter first
-        return (0, -len(content))
+        # Priority files first, shorter first
+        return (filename in priority_names, -len(content))
 
     file_diffs.sort(key=file_priority, reverse=True)
 
-    # Build truncated diff
-    result = []
+    # Build truncated diff, writing newline separators between file sections
+    result = io.StringIO()
+    write = result.write
     current_size = 0
     included_count = 0
 
     for filename, content in file_diffs:
-        if current_size + len(content) + 100 <= max_size:
-            result.append(content)
-            current_size += len(content) + 1
+        content_len = len(content)
+        if current_size + content_len + 100 <= max_size:
+            if included_count:
+                write('\n')
+            write(content)
+            current_size += content_len + 1
             included_count += 1
         elif current_size < max_size * 0.9:
             # Partially include this file
             remaining = max_size - current_size - 100
             truncated = truncate_content(content, remaining)
-            result.append(truncated)
+            if included_count:
+                write('\n')
+            write(truncated)
             current_size += len(truncated) + 1
             included_count += 1
             break
 
     if included_count < len(file_diffs):
-        result.append(f"\n... [{len(file_diffs) - included_count} more files not shown]")
+        if included_count:
+            write('\n')
+        write(f"\n... [{len(file_diffs) - included_count} more files not shown]")
 
-    return '\n'.join(result)
+    return result.getvalue()
@@ -7,6 +7,8 @@ This module contains:
 4. Logic defect patterns to check for
 """
 
+from functools import lru_cache
+
 # ============ False Positive Filtering Rules ============
 
 HARD_EXCLUSION_RULES = """HARD EXCLUSIONS - Automatically exclude findings matching these patterns:
@@ -340,6 +342,34 @@ STYLE_ENCAPSULATION_RULES = """CODE STYLE AND ENCAPSULATION - Check for these de
 
 # ============ Full Filtering Section for Review Prompt ============
 
+_SECURITY_FILTERING_SECTION = f"""{HARD_EXCLUSION_RULES}
+
+{SIGNAL_QUALITY_CRITERIA}
+
+{PRECEDENTS}"""
+
+
+@lru_cache(maxsize=8)
+def _build_review_filtering_section(
+    include_static_defects: bool,
+    include_logic_defects: bool,
+    include_style_encapsulation: bool
+) -> str:
+    """Compose the review filtering section for one flag combination."""
+    sections = [HARD_EXCLUSION_RULES, SIGNAL_QUALITY_CRITERIA, PRECEDENTS]
+
+    if include_static_defects:
+        sections.append(STATIC_DEFECT_RULES)
+
+    if include_logic_defects:
+        sections.append(LOGIC_DEFECT_RULES)
+
+    if include_style_encapsulation:
+        sections.append(STYLE_ENCAPSULATION_RULES)
+
+    return "\n\n".join(sections)
+
+
 def get_review_filtering_section(
     include_static_defects: bool = True,
     include_logic_defects: bool = True,
@@ -353,26 +383,15 @@ def get_review_filtering_section(
         include_style_encapsulation: Whether to include style and encapsulation rules
 
     Returns:
-        Formatted filtering section string
+        Formatted filtering section string, shared by all callers requesting
+        the same flag combination
     """
-    sections = [
-        HARD_EXCLUSION_RULES,
-        "",
-        SIGNAL_QUALITY_CRITERIA,
-        "",
-        PRECEDENTS,
-    ]
-
-    if include_static_defects:
-        sections.extend(["", STATIC_DEFECT_RULES])
-
-    if include_logic_defects:
-        sections.extend(["", LOGIC_DEFECT_RULES])
-
-    if include_style_encapsulation:
-        sections.extend(["", STYLE_ENCAPSULATION_RULES])
-
-    return "\n".join(sections)
+    # Normalize to positional bools so keyword/default call styles share one entry
+    return _build_review_filtering_section(
+        bool(include_static_defects),
+        bool(include_logic_defects),
+        bool(include_style_encapsulation),
+    )
 
 
 def get_security_filtering_section() -> str:
@@ -381,8 +400,4 @@ def get_security_filtering_section() -> str:
     Returns:
         Security-focused filtering section string
     """
-    return f"""{HARD_EXCLUSION_RULES}
-
-{SIGNAL_QUALITY_CRITERIA}
-
-{PRECEDENTS}"""
+    return _SECURITY_FILTERING_SECTION
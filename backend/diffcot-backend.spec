@@ -26,9 +26,12 @@ a = Analysis(
         'uvicorn.logging',
         'uvicorn.loops',
         'uvicorn.loops.auto',
+        'uvicorn.loops.asyncio',
+        'uvicorn.loops.uvloop',
         'uvicorn.protocols',
         'uvicorn.protocols.http',
         'uvicorn.protocols.http.auto',
+        'uvicorn.protocols.http.httptools_impl',
         'uvicorn.protocols.websockets',
         'uvicorn.protocols.websockets.auto',
         'uvicorn.lifespan',
@@ -57,6 +60,7 @@ a = Analysis(
         'client.symbol_extractor',
         'review_engine',
         'review_engine.review_workflow',
+        'review_engine.state',
         'configs',
         'configs.review_rules',
         'configs.pr_size_limits',
@@ -65,12 +69,16 @@ a = Analysis(
         'utils.logger',
         'utils.json_parser',
         'utils.paths',
+        'utils.content_cache',
+        'utils.review_cache',
         # LangGraph
         'langgraph',
         'langchain_core',
         # 其他
         'yaml',
         'httpx',
+        'orjson',
+        'httptools',
         'anthropic',
         'openai',
     ],
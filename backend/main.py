@@ -4,26 +4,49 @@ DiffCOT Code Review Backend
 FastAPI application for AI-powered code review.
 """
 
-from datetime import datetime
-from fastapi import FastAPI
+import time
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+import orjson
+from fastapi import APIRouter, FastAPI, Response
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 
 from api.routes import github_router, review_router, settings_router, conversations_router, semgrep_rules_router
 from api.models.schemas import HealthResponse
 from utils.logger import get_logger
+from utils.paths import is_packaged
 
 logger = get_logger(__name__)
 
 # Application version
 VERSION = "1.0.0"
 
+# Serialized /health body, refreshed at most once per second: [epoch_second, json_bytes]
+_health_cache = [0, b""]
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Application startup and shutdown."""
+    logger.info("Starting DiffCOT Code Review API v%s", VERSION)
+    if app.docs_url:
+        logger.info("API documentation available at /docs")
+    yield
+    logger.info("Shutting down DiffCOT Code Review API")
+
+
 # Create FastAPI application
 app = FastAPI(
     title="DiffCOT Code Review API",
     description="AI-powered code review for GitHub Pull Requests",
     version=VERSION,
-    docs_url="/docs",
-    redoc_url="/redoc",
+    # Packaged desktop builds never serve the interactive docs; skip schema generation
+    docs_url=None if is_packaged() else "/docs",
+    redoc_url=None,
+    openapi_url=None if is_packaged() else "/openapi.json",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
 # CORS middleware for frontend access
@@ -38,55 +61,57 @@ app.add_middleware(
         "http://127.0.0.1:8765",
     ],
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    # Explicit lists let Starlette precompute the preflight response headers
+    allow_methods=["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"],
+    allow_headers=["Authorization", "Content-Type", "X-Requested-With"],
 )
 
-# Include API routes
-app.include_router(github_router, prefix="/api")
-app.include_router(review_router, prefix="/api")
-app.include_router(settings_router, prefix="/api")
-app.include_router(conversations_router, prefix="/api")
-app.include_router(semgrep_rules_router, prefix="/api")
+# Include API routes under a single /api router
+api_router = APIRouter(prefix="/api")
+api_router.include_router(github_router)
+api_router.include_router(review_router)
+api_router.include_router(settings_router)
+api_router.include_router(conversations_router)
+api_router.include_router(semgrep_rules_router)
+app.include_router(api_router)
 
 
-@app.get("/health", response_model=HealthResponse)
-async def health_check() -> HealthResponse:
+# HealthResponse documents the body only; the handler bypasses response-model validation
+@app.get("/health", response_model=None, responses={200: {"model": HealthResponse}})
+async def health_check() -> Response:
     """Health check endpoint."""
-    return HealthResponse(
-        status="healthy",
-        version=VERSION,
-        timestamp=datetime.utcnow().isoformat()
-    )
+    now = int(time.time())
+    if now != _health_cache[0]:
+        _health_cache[0] = now
+        _health_cache[1] = orjson.dumps({
+            "status": "healthy",
+            "version": VERSION,
+            "timestamp": datetime.fromtimestamp(now, timezone.utc).isoformat(),
+        })
+    return Response(content=_health_cache[1], media_type="application/json")
+
+
+# Root payload never changes after startup
+_ROOT_BYTES = orjson.dumps({
+    "name": "DiffCOT Code Review API",
+    "version": VERSION,
+    "docs": app.docs_url,
+    "health": "/health",
+})
 
 
 @app.get("/")
-async def root():
+async def root() -> Response:
     """Root endpoint with API information."""
-    return {
-        "name": "DiffCOT Code Review API",
-        "version": VERSION,
-        "docs": "/docs",
-        "health": "/health",
-    }
-
-
-@app.on_event("startup")
-async def startup_event():
-    """Application startup event."""
-    logger.info(f"Starting DiffCOT Code Review API v{VERSION}")
-    logger.info("API documentation available at /docs")
-
-
-@app.on_event("shutdown")
-async def shutdown_event():
-    """Application shutdown event."""
-    logger.info("Shutting down DiffCOT Code Review API")
+    return Response(content=_ROOT_BYTES, media_type="application/json")
 
 
 if __name__ == "__main__":
+    import sys
     import uvicorn
-    from utils.paths import is_packaged
+
+    # uvloop does not support Windows; httptools works everywhere
+    loop = "asyncio" if sys.platform == "win32" else "uvloop"
 
     if is_packaged():
         # 打包后：直接传递 app 对象，禁用 reload
@@ -95,7 +120,9 @@ if __name__ == "__main__":
             host="127.0.0.1",
             port=8765,
             reload=False,
-            log_level="info"
+            log_level="info",
+            loop=loop,
+            http="httptools"
         )
     else:
         # 开发模式：使用字符串形式支持 reload
@@ -104,5 +131,7 @@ if __name__ == "__main__":
             host="127.0.0.1",
             port=8765,
             reload=True,
-            log_level="info"
+            log_level="info",
+            loop=loop,
+            http="httptools"
         )
@@ -1,15 +1,24 @@
 """Review engine module for LangGraph-based code review."""
 
-from review_engine.review_workflow import (
-    create_review_workflow,
-    run_review_workflow,
-    ReviewState,
-    IntentAnalysis,
-)
+from review_engine.state import ReviewState, IntentAnalysis, create_initial_state
 
 __all__ = [
     'create_review_workflow',
     'run_review_workflow',
+    'run_review_workflow_batch',
     'ReviewState',
     'IntentAnalysis',
+    'create_initial_state',
 ]
+
+# Workflow functions pull in LangGraph and the API clients; load them on first access
+_LAZY_WORKFLOW_ATTRS = {'create_review_workflow', 'run_review_workflow', 'run_review_workflow_batch'}
+
+
+def __getattr__(name):
+    if name in _LAZY_WORKFLOW_ATTRS:
+        from review_engine import review_workflow
+        value = getattr(review_workflow, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
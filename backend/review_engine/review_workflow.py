@@ -7,10 +7,11 @@ This module implements a two-agent workflow:
 Both agents run in PARALLEL and their results are combined for the final code review.
 """
 
+import io
 import time
+import logging
 import asyncio
-from typing import Dict, Any, List, Optional, TypedDict
-from dataclasses import dataclass
+from typing import Dict, Any, List, Optional
 
 from langgraph.graph import StateGraph, END
 
@@ -24,84 +25,23 @@ from configs.pr_size_limits import (
     DEFAULT_LIMITS, PRSizeMetrics, calculate_pr_metrics,
     truncate_content, prioritize_files, smart_diff_truncate
 )
+from review_engine.state import ReviewState, IntentAnalysis, create_initial_state
 from utils.logger import get_logger
 from utils.json_parser import parse_json_with_fallbacks
+from utils import review_cache
 
 logger = get_logger(__name__)
 
+# Small diffs that only touch documentation, or only change trailing
+# whitespace and blank lines, carry no intent worth an LLM call. Config
+# files (CI workflows, dependency manifests) always get a real analysis.
+_TRIVIAL_DIFF_MAX_CHARS = 500
+_DOC_EXTENSIONS = frozenset({'.md', '.rst', '.adoc'})
+# Whitespace changes in these files can change behavior
+_INDENT_SENSITIVE_EXTENSIONS = frozenset({'.py', '.pyi', '.yaml', '.yml'})
 
-# ============ State Definitions ============
-
-class ReviewState(TypedDict, total=False):
-    """State shared across all workflow nodes.
-
-    Input fields are plain types (set once, never overwritten).
-    Output fields from parallel nodes use plain types too - LangGraph
-    handles merging automatically since each parallel node writes to
-    different keys.
-    """
-    # Input data - set once at start, read-only by nodes
-    repo_owner: str
-    repo_name: str
-    pr_number: int
-    provider: str
-    model: Optional[str]
-    github_token: Optional[str]
-    api_key: Optional[str]
-
-    # PR data from GitHub - set by fetch_pr_data
-    pr_info: Dict[str, Any]
-    diff_content: str
-    files: List[Dict[str, Any]]
-    pr_context: Dict[str, Any]
-
-    # Extracted context - set by fetch_pr_data
-    extracted_context: Optional[Dict[str, Any]]
-    context_prompt_section: str
-
-    # SAST results - set by run_sast_analysis only
-    sast_success: bool
-    sast_findings: List[Dict[str, Any]]
-    sast_error: Optional[str]
-    sast_prompt_section: str
-    sast_duration_ms: int
-    languages_detected: List[str]
-
-    # Symbol table - set by run_sast_analysis
-    symbol_table_prompt: str
-
-    # Intent analysis results - set by run_intent_analysis only
-    intent_success: bool
-    intent_analysis: Dict[str, Any]
-    intent_error: Optional[str]
-    intent_duration_ms: int
-
-    # Final output - set by combine_results
-    combined_prompt: str
-    workflow_error: Optional[str]
-
-
-@dataclass
-class IntentAnalysis:
-    """Result of intent analysis."""
-    purpose: str
-    implementation_approach: str
-    key_changes: List[str]
-    potential_issues: List[str]
-    missing_considerations: List[str]
-    architectural_impact: str
-    confidence: float
-
-    def to_dict(self) -> Dict[str, Any]:
-        return {
-            "purpose": self.purpose,
-            "implementation_approach": self.implementation_approach,
-            "key_changes": self.key_changes,
-            "potential_issues": self.potential_issues,
-            "missing_considerations": self.missing_considerations,
-            "architectural_impact": self.architectural_impact,
-            "confidence": self.confidence
-        }
+# Running workflows keyed by (repo_owner, repo_name, pr_number, provider, model)
+_inflight: Dict[tuple, "asyncio.Future[Dict[str, Any]]"] = {}
 
 
 # ============ Workflow Nodes ============
@@ -123,11 +63,14 @@ async def fetch_pr_data(state: ReviewState) -> Dict[str, Any]:
             logger.error(f"Missing required state values: repo_owner={repo_owner!r}, repo_name={repo_name!r}, pr_number={pr_number!r}")
             return {'workflow_error': 'Missing required PR identification in state'}
 
-        # Get basic PR review data
-        review_data = github_client.get_pr_review_data(
-            repo_owner,
-            repo_name,
-            pr_number
+        # Fetch PR details, changed files and diff concurrently (independent requests)
+        pr_details, pr_files, pr_diff = await asyncio.gather(
+            asyncio.to_thread(github_client.get_pull_request, repo_owner, repo_name, pr_number),
+            asyncio.to_thread(github_client.get_pull_request_files, repo_owner, repo_name, pr_number),
+            asyncio.to_thread(github_client.get_pull_request_diff, repo_owner, repo_name, pr_number),
+        )
+        review_data = github_client.build_pr_review_data(
+            repo_owner, repo_name, pr_number, pr_details, pr_files, pr_diff
         )
 
         # Calculate PR size metrics for optimization decisions
@@ -161,6 +104,7 @@ async def fetch_pr_data(state: ReviewState) -> Dict[str, Any]:
                 'pr_context': review_data['context'],
                 'extracted_context': {
                     'changed_files': [],  # No full file content
+                    'full_file_contents': {},
                     'related_files': [],
                     'repo_structure': None,
                     'import_graph': {},
@@ -206,19 +150,28 @@ async def fetch_pr_data(state: ReviewState) -> Dict[str, Any]:
             diff_content=diff_content  # NEW: Pass diff to extract new imports
         )
 
+        # Render the repo tree once; it is shared by state and the prompt section
+        repo_structure = extracted.repo_structure
+        tree_string = repo_structure.to_tree_string(max_depth=3)[:2000] if repo_structure else ""
+
         # Convert to dict for state storage
-        # Keep full content for SAST analysis, truncated content for LLM prompts
+        # Keep full content for SAST analysis; prompt builders truncate at use.
+        # The SAST path -> content map is built in the same pass over the files.
+        changed_files = []
+        full_file_contents = {}
+        for f in extracted.changed_files[:DEFAULT_LIMITS.max_files_for_full_analysis]:
+            changed_files.append({
+                'path': f.path,
+                'content': f.content,  # Full content for SAST/symbol extraction
+                'language': f.language,
+                'size': f.size
+            })
+            if f.path and f.content:
+                full_file_contents[f.path] = f.content
+
         extracted_context = {
-            'changed_files': [
-                {
-                    'path': f.path,
-                    'content': f.content,  # Full content for SAST/symbol extraction
-                    'content_for_prompt': f.content[:DEFAULT_LIMITS.max_file_content_size],  # Truncated for LLM
-                    'language': f.language,
-                    'size': f.size
-                }
-                for f in extracted.changed_files[:DEFAULT_LIMITS.max_files_for_full_analysis]
-            ],
+            'changed_files': changed_files,
+            'full_file_contents': full_file_contents,
             'related_files': [
                 {'path': f.path, 'content': f.content[:DEFAULT_LIMITS.max_related_file_size], 'language': f.language, 'size': f.size}
                 for f in extracted.related_files[:DEFAULT_LIMITS.max_related_files]
@@ -229,10 +182,10 @@ async def fetch_pr_data(state: ReviewState) -> Dict[str, Any]:
                 for f in extracted.diff_imported_files[:DEFAULT_LIMITS.max_diff_imported_files]
             ],
             'repo_structure': {
-                'tree_string': extracted.repo_structure.to_tree_string()[:2000] if extracted.repo_structure else "",
-                'languages': extracted.repo_structure.languages[:10] if extracted.repo_structure else [],
-                'file_count': extracted.repo_structure.file_count if extracted.repo_structure else 0,
-            } if extracted.repo_structure else None,
+                'tree_string': tree_string,
+                'languages': repo_structure.languages[:10],
+                'file_count': repo_structure.file_count,
+            } if repo_structure else None,
             'import_graph': extracted.import_graph,
             'diff_only_mode': False,
         }
@@ -248,7 +201,10 @@ async def fetch_pr_data(state: ReviewState) -> Dict[str, Any]:
             'files': files_to_process,
             'pr_context': review_data['context'],
             'extracted_context': extracted_context,
-            'context_prompt_section': extracted.to_prompt_section(max_total_size=DEFAULT_LIMITS.max_context_prompt_size),
+            'context_prompt_section': extracted.to_prompt_section(
+                max_total_size=DEFAULT_LIMITS.max_context_prompt_size,
+                tree_string=tree_string
+            ),
         }
 
     except Exception as e:
@@ -271,17 +227,11 @@ async def run_sast_analysis(state: ReviewState) -> Dict[str, Any]:
         extracted_context = state.get('extracted_context')
         diff_only_mode = extracted_context.get('diff_only_mode', False) if extracted_context else False
 
-        # Extract full file contents from extracted_context if available
-        # Use full 'content' field (not truncated 'content_for_prompt') for SAST analysis
+        # Full file contents for SAST, already mapped by path in fetch_pr_data
         full_file_contents = None
         if extracted_context and not diff_only_mode:
-            changed_files = extracted_context.get('changed_files', [])
-            if changed_files:
-                full_file_contents = {
-                    f['path']: f['content']
-                    for f in changed_files
-                    if f.get('path') and f.get('content')
-                }
+            full_file_contents = extracted_context.get('full_file_contents')
+            if full_file_contents and logger.isEnabledFor(logging.INFO):
                 # Log total content size to verify full files are being used
                 total_content_size = sum(len(c) for c in full_file_contents.values())
                 logger.info(f"Using full content for {len(full_file_contents)} files in SAST (total: {total_content_size} chars)")
@@ -383,9 +333,30 @@ async def run_intent_analysis(state: ReviewState) -> Dict[str, Any]:
     logger.info("Running intent analysis...")
     start_time = time.time()
 
+    trivial_result = _get_trivial_intent_result(state)
+    if trivial_result is not None:
+        logger.info("Trivial change detected, skipping intent analysis LLM call")
+        return trivial_result
+
     try:
-        # Get AI client based on provider
+        # Build intent analysis prompt
+        prompt = _build_intent_analysis_prompt(state)
+        system_prompt = _get_intent_system_prompt()
+
+        # Reuse the result of an identical request (same model and prompts)
         provider = state.get('provider', 'glm').lower()
+        cache_key = review_cache.review_cache_key(provider, state.get('model'), system_prompt, prompt)
+        cached_analysis = await asyncio.to_thread(review_cache.get, cache_key)
+        if cached_analysis is not None:
+            logger.info("Reusing cached intent analysis for identical prompt")
+            return {
+                'intent_success': True,
+                'intent_analysis': cached_analysis,
+                'intent_error': None,
+                'intent_duration_ms': int((time.time() - start_time) * 1000),
+            }
+
+        # Get AI client based on provider
         api_key = state.get('api_key')
 
         if provider == 'glm':
@@ -395,16 +366,12 @@ async def run_intent_analysis(state: ReviewState) -> Dict[str, Any]:
         else:
             raise ValueError(f"Unknown provider: {provider}")
 
-        # Build intent analysis prompt
-        prompt = _build_intent_analysis_prompt(state)
-        system_prompt = _get_intent_system_prompt()
-
-        # Call AI in thread pool
-        success, response_text, error = await asyncio.to_thread(
-            ai_client.call_with_retry,
+        # Call AI on the event loop, streaming so the call returns when the JSON closes
+        success, response_text, error = await ai_client.call_with_retry_async(
             prompt=prompt,
             system_prompt=system_prompt,
-            max_tokens=4096
+            max_tokens=4096,
+            stop_at_json_end=True  # Skip any trailing tokens after the JSON result
         )
 
         duration_ms = int((time.time() - start_time) * 1000)
@@ -415,6 +382,8 @@ async def run_intent_analysis(state: ReviewState) -> Dict[str, Any]:
 
             if parse_success:
                 logger.info(f"Intent analysis completed in {duration_ms}ms")
+                # Only successful results are cached so failures are retried
+                await asyncio.to_thread(review_cache.put, cache_key, parsed_result)
                 return {
                     'intent_success': True,
                     'intent_analysis': parsed_result,
@@ -449,6 +418,75 @@ async def run_intent_analysis(state: ReviewState) -> Dict[str, Any]:
         }
 
 
+def _get_trivial_intent_result(state: ReviewState) -> Optional[Dict[str, Any]]:
+    """Return a canned intent result for trivial PRs, or None if analysis is needed.
+
+    Args:
+        state: Current workflow state
+
+    Returns:
+        Intent node output for a trivial change, or None
+    """
+    diff_content = state.get('diff_content', '')
+    files = state.get('files', [])
+    if not files or len(diff_content) >= _TRIVIAL_DIFF_MAX_CHARS:
+        return None
+
+    extensions = [_file_extension(f.get('filename', '')) for f in files]
+    if all(ext in _DOC_EXTENSIONS for ext in extensions):
+        purpose = 'Trivial change (documentation only)'
+    elif (
+        not any(ext in _INDENT_SENSITIVE_EXTENSIONS for ext in extensions)
+        and _is_whitespace_only_diff(diff_content)
+    ):
+        purpose = 'Trivial change (trailing whitespace/blank lines only)'
+    else:
+        return None
+
+    return {
+        'intent_success': True,
+        'intent_analysis': {
+            'purpose': purpose,
+            'implementation_approach': 'N/A',
+            'key_changes': [f"Updated {f.get('filename', '')}" for f in state.get('files', [])[:10]],
+            'potential_issues': [],
+            'missing_considerations': [],
+            'architectural_impact': 'none',
+            # Classified by a size/file-type heuristic, not by the LLM
+            'confidence': 0.5,
+        },
+        'intent_error': None,
+        'intent_duration_ms': 0,
+    }
+
+
+def _file_extension(filename: str) -> str:
+    """Return the lowercased final extension of filename, or ''."""
+    dot = filename.rfind('.')
+    return filename[dot:].lower() if dot > filename.rfind('/') else ''
+
+
+def _is_whitespace_only_diff(diff_content: str) -> bool:
+    """Check whether a diff only changes trailing whitespace or blank lines.
+
+    Leading indentation and whitespace inside lines are significant. A diff
+    without any added or removed lines (binary files, empty diff) is not
+    considered whitespace-only.
+    """
+    added = []
+    removed = []
+    has_changes = False
+    for line in diff_content.splitlines():
+        if line.startswith(('+++', '---')):
+            continue
+        if line.startswith(('+', '-')):
+            has_changes = True
+            content = line[1:].rstrip()
+            if content:
+                (added if line[0] == '+' else removed).append(content)
+    return has_changes and added == removed
+
+
 def _get_intent_system_prompt() -> str:
     """Get system prompt for intent analysis."""
     return """You are an expert software architect analyzing code changes to understand their intent and purpose.
@@ -472,69 +510,70 @@ def _build_intent_analysis_prompt(state: ReviewState) -> str:
     max_prompt_size = 60000
     current_size = 0
 
-    # Build context sections with budget tracking
-    context_section = ""
+    # Build context sections with budget tracking; joined once at the end
+    parts: List[str] = []
     if context:
         # Repository structure (small, always include)
         repo_struct = context.get('repo_structure', {})
         if repo_struct and repo_struct.get('tree_string'):
             struct_text = f"\n## Repository Structure\n```\n{repo_struct['tree_string'][:1500]}\n```\n"
-            context_section += struct_text
+            parts.append(struct_text)
             current_size += len(struct_text)
 
         # Changed files with full content (budget: 40% of remaining)
         changed_files = context.get('changed_files', [])
         if changed_files:
             files_budget = int((max_prompt_size - current_size) * 0.4)
-            context_section += "\n## Changed Files (Full Content)\n"
+            parts.append("\n## Changed Files (Full Content)\n")
             current_size += 35
 
             max_files = min(len(changed_files), 5)
             per_file_budget = files_budget // max(max_files, 1)
 
             for f in changed_files[:max_files]:
-                file_limit = min(per_file_budget, 8000)
-                # Use content_for_prompt if available (truncated), fall back to content
-                file_content = f.get('content_for_prompt', f.get('content', ''))
-                content = file_content[:file_limit] if len(file_content) > file_limit else file_content
+                file_limit = min(per_file_budget, 8000, DEFAULT_LIMITS.max_file_content_size)
+                # Slicing returns the original string when it already fits
+                content = f.get('content', '')[:file_limit]
                 file_text = f"\n### {f['path']}\n```{f['language']}\n{content}\n```\n"
-                context_section += file_text
+                parts.append(file_text)
                 current_size += len(file_text)
 
         # Related files (budget: 15% of remaining, if space allows)
         related_files = context.get('related_files', [])
         remaining_for_related = max_prompt_size - current_size - 20000  # Reserve for diff
         if related_files and remaining_for_related > 2000:
-            context_section += "\n## Related Context Files\n"
+            parts.append("\n## Related Context Files\n")
             current_size += 30
 
             max_related = min(len(related_files), 2)
             per_file_limit = min(remaining_for_related // max(max_related, 1), 3000)
 
             for f in related_files[:max_related]:
-                content = f['content'][:per_file_limit] if len(f['content']) > per_file_limit else f['content']
+                content = f['content'][:per_file_limit]
                 file_text = f"\n### {f['path']}\n```{f['language']}\n{content}\n```\n"
-                context_section += file_text
+                parts.append(file_text)
                 current_size += len(file_text)
 
         # NEW: Diff-imported files (HIGH PRIORITY - newly added imports in this PR)
         diff_imported_files = context.get('diff_imported_files', [])
         remaining_for_imports = max_prompt_size - current_size - 15000  # Reserve for diff
         if diff_imported_files and remaining_for_imports > 3000:
-            context_section += "\n## Newly Imported Files (Cross-File Analysis)\n"
-            context_section += "**IMPORTANT: These files are NEWLY IMPORTED in this PR.**\n"
-            context_section += "**Check if the usage of these components/functions is correct (props, signatures, types).**\n\n"
+            parts.append("\n## Newly Imported Files (Cross-File Analysis)\n")
+            parts.append("**IMPORTANT: These files are NEWLY IMPORTED in this PR.**\n")
+            parts.append("**Check if the usage of these components/functions is correct (props, signatures, types).**\n\n")
             current_size += 180
 
             max_imports = min(len(diff_imported_files), 5)
             per_file_limit = min(remaining_for_imports // max(max_imports, 1), 6000)
 
             for f in diff_imported_files[:max_imports]:
-                content = f['content'][:per_file_limit] if len(f['content']) > per_file_limit else f['content']
+                content = f['content'][:per_file_limit]
                 file_text = f"\n### {f['path']}\n```{f['language']}\n{content}\n```\n"
-                context_section += file_text
+                parts.append(file_text)
                 current_size += len(file_text)
 
+    context_section = "".join(parts)
+
     # Calculate remaining budget for diff
     diff_budget = max(max_prompt_size - current_size - 2000, 10000)
     diff_content = state.get('diff_content', '')
@@ -594,63 +633,82 @@ def combine_analysis_results(state: ReviewState) -> Dict[str, Any]:
     """Combine SAST and Intent Analysis results into final prompt."""
     logger.info("Combining analysis results...")
 
-    sections = []
+    buf = io.StringIO()
+    w = buf.write
 
     # Add context section
     if state.get('context_prompt_section'):
-        sections.append(state['context_prompt_section'])
+        w(state['context_prompt_section'])
 
     # Add SAST results section
     if state.get('sast_success') and state.get('sast_prompt_section'):
-        sections.append("\n---\n## Static Analysis (SAST) Findings\n")
-        sections.append(state['sast_prompt_section'])
-        sections.append(f"\n*SAST completed in {state.get('sast_duration_ms', 0)}ms*\n")
+        w("\n---\n## Static Analysis (SAST) Findings\n")
+        w(state['sast_prompt_section'])
+        w(f"\n*SAST completed in {state.get('sast_duration_ms', 0)}ms*\n")
     elif state.get('sast_error'):
-        sections.append(f"\n---\n## SAST Analysis\n⚠️ SAST analysis failed: {state['sast_error']}\n")
+        w(f"\n---\n## SAST Analysis\n⚠️ SAST analysis failed: {state['sast_error']}\n")
 
     # Add Symbol Table for cross-file validation
     if state.get('symbol_table_prompt'):
-        sections.append("\n---\n")
-        sections.append(state['symbol_table_prompt'])
+        w("\n---\n")
+        w(state['symbol_table_prompt'])
 
     # Add Intent Analysis results section
     if state.get('intent_success') and state.get('intent_analysis'):
         intent = state['intent_analysis']
-        sections.append("\n---\n## Intent Analysis\n")
-        sections.append(f"\n### Purpose\n{intent.get('purpose', 'Not determined')}\n")
-        sections.append(f"\n### Implementation Approach\n{intent.get('implementation_approach', 'Not analyzed')}\n")
+        w("\n---\n## Intent Analysis\n")
+        w(f"\n### Purpose\n{intent.get('purpose', 'Not determined')}\n")
+        w(f"\n### Implementation Approach\n{intent.get('implementation_approach', 'Not analyzed')}\n")
 
         if intent.get('key_changes'):
-            sections.append("\n### Key Changes\n")
-            for change in intent['key_changes']:
-                sections.append(f"- {change}\n")
+            w("\n### Key Changes\n")
+            w("".join(f"- {change}\n" for change in intent['key_changes']))
 
         if intent.get('potential_issues'):
-            sections.append("\n### Potential Issues (from Intent Analysis)\n")
-            for issue in intent['potential_issues']:
-                sections.append(f"- ⚠️ {issue}\n")
+            w("\n### Potential Issues (from Intent Analysis)\n")
+            w("".join(f"- ⚠️ {issue}\n" for issue in intent['potential_issues']))
 
         if intent.get('missing_considerations'):
-            sections.append("\n### Missing Considerations\n")
-            for consideration in intent['missing_considerations']:
-                sections.append(f"- 💡 {consideration}\n")
+            w("\n### Missing Considerations\n")
+            w("".join(f"- 💡 {consideration}\n" for consideration in intent['missing_considerations']))
 
         if intent.get('architectural_impact'):
-            sections.append(f"\n### Architectural Impact\n{intent['architectural_impact']}\n")
+            w(f"\n### Architectural Impact\n{intent['architectural_impact']}\n")
 
         confidence = intent.get('confidence', 0)
-        sections.append(f"\n*Intent Analysis Confidence: {confidence:.0%}*\n")
-        sections.append(f"*Intent Analysis completed in {state.get('intent_duration_ms', 0)}ms*\n")
+        w(f"\n*Intent Analysis Confidence: {confidence:.0%}*\n")
+        w(f"*Intent Analysis completed in {state.get('intent_duration_ms', 0)}ms*\n")
 
     elif state.get('intent_error'):
-        sections.append(f"\n---\n## Intent Analysis\n⚠️ Intent analysis failed: {state['intent_error']}\n")
+        w(f"\n---\n## Intent Analysis\n⚠️ Intent analysis failed: {state['intent_error']}\n")
 
-    combined_prompt = "".join(sections)
+    combined_prompt = buf.getvalue()
     logger.info(f"Combined prompt length: {len(combined_prompt)} chars")
 
     return {'combined_prompt': combined_prompt}
 
 
+async def run_parallel_analysis(state: ReviewState) -> Dict[str, Any]:
+    """Run SAST and intent analysis concurrently, then combine their results.
+
+    Both analyses always run, so they are fanned out with asyncio directly
+    rather than as separate graph nodes with their own state merges. They
+    read the same state mapping, so the large extracted_context is shared
+    by reference and must be treated as read-only.
+
+    Intent results for an identical prompt are served from the review
+    cache inside run_intent_analysis; SAST relies on its per-file Semgrep
+    cache, which is keyed on the rules.
+    """
+    sast_result, intent_result = await asyncio.gather(
+        run_sast_analysis(state),
+        run_intent_analysis(state),
+    )
+    updates = {**sast_result, **intent_result}
+    updates.update(combine_analysis_results({**state, **updates}))
+    return updates
+
+
 def should_continue_after_fetch(state: ReviewState) -> str:
     """Determine if workflow should continue after fetching PR data."""
     if state.get('workflow_error'):
@@ -663,12 +721,12 @@ def should_continue_after_fetch(state: ReviewState) -> str:
 def create_review_workflow() -> StateGraph:
     """Create the LangGraph workflow for code review.
 
-    Workflow structure with PARALLEL execution:
+    Workflow structure:
     1. fetch_pr_data: Get PR info and extended context
-    2. PARALLEL (fan-out from fetch_pr_data):
+    2. parallel_analysis: run in PARALLEL via asyncio, then combine
        - run_sast_analysis: Static code analysis
        - run_intent_analysis: Intent understanding with LLM
-    3. combine_results: Merge all analysis for final review (fan-in)
+       - combine_analysis_results: Merge all analysis for final review
 
     Returns:
         Compiled StateGraph workflow
@@ -677,34 +735,23 @@ def create_review_workflow() -> StateGraph:
 
     # Add nodes
     workflow.add_node("fetch_pr_data", fetch_pr_data)
-    workflow.add_node("run_sast_analysis", run_sast_analysis)
-    workflow.add_node("run_intent_analysis", run_intent_analysis)
-    workflow.add_node("combine_results", combine_analysis_results)
+    workflow.add_node("parallel_analysis", run_parallel_analysis)
 
     # Set entry point
     workflow.set_entry_point("fetch_pr_data")
 
-    # Conditional routing after fetch - check for errors before parallel execution
+    # Conditional routing after fetch - skip analysis on errors
     workflow.add_conditional_edges(
         "fetch_pr_data",
         should_continue_after_fetch,
         {
-            "continue": "run_sast_analysis",  # This triggers SAST
+            "continue": "parallel_analysis",
             "error": END
         }
     )
 
-    # Add second edge from fetch_pr_data to run_intent_analysis for parallel fan-out
-    # When fetch completes successfully, BOTH edges are followed in parallel
-    workflow.add_edge("fetch_pr_data", "run_intent_analysis")
-
-    # Fan-in: Both analysis nodes converge to combine_results
-    # combine_results will wait for BOTH nodes to complete before executing
-    workflow.add_edge("run_sast_analysis", "combine_results")
-    workflow.add_edge("run_intent_analysis", "combine_results")
-
-    # Combine leads to end
-    workflow.add_edge("combine_results", END)
+    # Analysis leads to end
+    workflow.add_edge("parallel_analysis", END)
 
     return workflow.compile()
 
@@ -720,6 +767,9 @@ async def run_review_workflow(
 ) -> Dict[str, Any]:
     """Run the complete review workflow.
 
+    Concurrent calls for the same PR, provider and model (e.g. webhook
+    retries) share one in-flight run instead of repeating the pipeline.
+
     Args:
         repo_owner: Repository owner
         repo_name: Repository name
@@ -732,48 +782,86 @@ async def run_review_workflow(
     Returns:
         Final workflow state with all analysis results
     """
+    key = (repo_owner, repo_name, pr_number, provider, model)
+    task = _inflight.get(key)
+    if task is not None:
+        logger.info(f"Joining in-flight review for {repo_owner}/{repo_name}#{pr_number}")
+    else:
+        task = asyncio.ensure_future(_execute_review_workflow(
+            repo_owner, repo_name, pr_number, provider, model, github_token, api_key
+        ))
+        _inflight[key] = task
+        task.add_done_callback(lambda _: _inflight.pop(key, None))
+
+    # Shield so one caller cancelling does not cancel the run for the others
+    return await asyncio.shield(task)
+
+
+async def _execute_review_workflow(
+    repo_owner: str,
+    repo_name: str,
+    pr_number: int,
+    provider: str,
+    model: Optional[str],
+    github_token: Optional[str],
+    api_key: Optional[str]
+) -> Dict[str, Any]:
+    """Build the initial state and invoke the workflow graph once."""
     logger.info(f"Starting review workflow for {repo_owner}/{repo_name}#{pr_number}")
-    logger.debug(f"Workflow input params: repo_owner={repo_owner!r}, repo_name={repo_name!r}, pr_number={pr_number!r}")
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
+    if debug_enabled:
+        logger.debug(f"Workflow input params: repo_owner={repo_owner!r}, repo_name={repo_name!r}, pr_number={pr_number!r}")
 
     # Initialize state with all required fields
-    initial_state: ReviewState = {
-        'repo_owner': repo_owner,
-        'repo_name': repo_name,
-        'pr_number': pr_number,
-        'provider': provider,
-        'model': model,
-        'github_token': github_token,
-        'api_key': api_key,
-        'pr_info': {},
-        'diff_content': '',
-        'files': [],
-        'pr_context': {},
-        'extracted_context': None,
-        'context_prompt_section': '',
-        'sast_success': False,
-        'sast_findings': [],
-        'sast_error': None,
-        'sast_prompt_section': '',
-        'sast_duration_ms': 0,
-        'languages_detected': [],
-        'symbol_table_prompt': '',
-        'intent_success': False,
-        'intent_analysis': {},
-        'intent_error': None,
-        'intent_duration_ms': 0,
-        'combined_prompt': '',
-        'workflow_error': None
-    }
+    initial_state = create_initial_state(
+        repo_owner=repo_owner,
+        repo_name=repo_name,
+        pr_number=pr_number,
+        provider=provider,
+        model=model,
+        github_token=github_token,
+        api_key=api_key
+    )
 
-    logger.debug(f"Initial state created: repo_owner={initial_state['repo_owner']!r}, repo_name={initial_state['repo_name']!r}, pr_number={initial_state['pr_number']!r}")
+    if debug_enabled:
+        logger.debug(f"Initial state created: repo_owner={initial_state['repo_owner']!r}, repo_name={initial_state['repo_name']!r}, pr_number={initial_state['pr_number']!r}")
 
     # Create and run workflow
     workflow = create_review_workflow()
 
     # Run the workflow
-    logger.debug("Invoking workflow with initial state...")
+    if debug_enabled:
+        logger.debug("Invoking workflow with initial state...")
     final_state = await workflow.ainvoke(initial_state)
 
     logger.info("Review workflow completed")
 
     return final_state
+
+
+async def run_review_workflow_batch(
+    jobs: List[Dict[str, Any]],
+    concurrency: int = 8
+) -> List[Any]:
+    """Run review workflows for several PRs concurrently.
+
+    Reviews are I/O bound (GitHub, Semgrep, LLM calls), so overlapping them
+    cuts wall-clock time for batch runs; the semaphore keeps the number of
+    in-flight reviews within API rate limits.
+
+    Args:
+        jobs: Keyword arguments for run_review_workflow, one dict per PR
+        concurrency: Maximum number of workflows running at once
+
+    Returns:
+        Final workflow states in job order; a job that raised is returned
+        as its exception instead of cancelling the rest of the batch
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _run_one(job: Dict[str, Any]) -> Dict[str, Any]:
+        async with semaphore:
+            return await run_review_workflow(**job)
+
+    logger.info(f"Starting batch review of {len(jobs)} PRs (concurrency={concurrency})")
+    return await asyncio.gather(*(_run_one(job) for job in jobs), return_exceptions=True)
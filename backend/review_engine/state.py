@@ -0,0 +1,142 @@
+"""State types for the code review workflow.
+
+Kept free of LangGraph and client imports so consumers that only need the
+type definitions do not pay for the full workflow import.
+"""
+
+from typing import Dict, Any, List, Optional, TypedDict
+from dataclasses import dataclass
+
+
+# ============ State Definitions ============
+
+class ReviewState(TypedDict, total=False):
+    """State shared across all workflow nodes.
+
+    Input fields are plain types (set once, never overwritten).
+    Output fields from parallel nodes use plain types too - LangGraph
+    handles merging automatically since each parallel node writes to
+    different keys.
+    """
+    # Input data - set once at start, read-only by nodes
+    repo_owner: str
+    repo_name: str
+    pr_number: int
+    provider: str
+    model: Optional[str]
+    github_token: Optional[str]
+    api_key: Optional[str]
+
+    # PR data from GitHub - set by fetch_pr_data
+    pr_info: Dict[str, Any]
+    diff_content: str
+    files: List[Dict[str, Any]]
+    pr_context: Dict[str, Any]
+
+    # Extracted context - set by fetch_pr_data
+    extracted_context: Optional[Dict[str, Any]]
+    context_prompt_section: str
+
+    # SAST results - set by run_sast_analysis only
+    sast_success: bool
+    sast_findings: List[Dict[str, Any]]
+    sast_error: Optional[str]
+    sast_prompt_section: str
+    sast_duration_ms: int
+    languages_detected: List[str]
+
+    # Symbol table - set by run_sast_analysis
+    symbol_table_prompt: str
+
+    # Intent analysis results - set by run_intent_analysis only
+    intent_success: bool
+    intent_analysis: Dict[str, Any]
+    intent_error: Optional[str]
+    intent_duration_ms: int
+
+    # Final output - set by combine_analysis_results (within parallel_analysis)
+    combined_prompt: str
+    workflow_error: Optional[str]
+
+
+# Immutable starting values for node outputs; mutable containers are
+# created per state in create_initial_state so runs never share them
+_OUTPUT_DEFAULTS: Dict[str, Any] = {
+    'diff_content': '',
+    'extracted_context': None,
+    'context_prompt_section': '',
+    'sast_success': False,
+    'sast_error': None,
+    'sast_prompt_section': '',
+    'sast_duration_ms': 0,
+    'symbol_table_prompt': '',
+    'intent_success': False,
+    'intent_error': None,
+    'intent_duration_ms': 0,
+    'combined_prompt': '',
+    'workflow_error': None,
+}
+
+
+def create_initial_state(
+    repo_owner: str,
+    repo_name: str,
+    pr_number: int,
+    provider: str,
+    model: Optional[str] = None,
+    github_token: Optional[str] = None,
+    api_key: Optional[str] = None
+) -> ReviewState:
+    """Create a workflow state with every field initialized.
+
+    Args:
+        repo_owner: Repository owner
+        repo_name: Repository name
+        pr_number: PR number
+        provider: AI provider ('glm' or 'anthropic')
+        model: Optional model override
+        github_token: GitHub API token
+        api_key: AI provider API key
+
+    Returns:
+        Initial ReviewState
+    """
+    return ReviewState(
+        repo_owner=repo_owner,
+        repo_name=repo_name,
+        pr_number=pr_number,
+        provider=provider,
+        model=model,
+        github_token=github_token,
+        api_key=api_key,
+        pr_info={},
+        files=[],
+        pr_context={},
+        sast_findings=[],
+        languages_detected=[],
+        intent_analysis={},
+        **_OUTPUT_DEFAULTS
+    )
+
+
+@dataclass
+class IntentAnalysis:
+    """Result of intent analysis."""
+    purpose: str
+    implementation_approach: str
+    key_changes: List[str]
+    potential_issues: List[str]
+    missing_considerations: List[str]
+    architectural_impact: str
+    confidence: float
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "purpose": self.purpose,
+            "implementation_approach": self.implementation_approach,
+            "key_changes": self.key_changes,
+            "potential_issues": self.potential_issues,
+            "missing_considerations": self.missing_considerations,
+            "architectural_impact": self.architectural_impact,
+            "confidence": self.confidence
+        }
@@ -10,6 +10,7 @@ from utils.paths import (
     get_reviews_dir,
     get_logs_dir,
     get_config_dir,
+    get_cache_dir,
     get_bundled_resources_dir,
 )
 
@@ -24,5 +25,6 @@ __all__ = [
     'get_reviews_dir',
     'get_logs_dir',
     'get_config_dir',
+    'get_cache_dir',
     'get_bundled_resources_dir',
 ]
@@ -0,0 +1,117 @@
+"""Disk cache for per-file analysis results keyed by content hash.
+
+Used to skip re-running Semgrep and symbol extraction on files whose
+content was already analyzed, e.g. when a PR is re-reviewed after a push.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Optional, Set
+
+from utils.logger import get_logger
+from utils.paths import get_cache_dir
+
+logger = get_logger(__name__)
+
+# Cached entries older than this are treated as misses
+DEFAULT_TTL_SECONDS = 7 * 24 * 60 * 60
+
+
+def content_hash(*parts: str) -> str:
+    """Hash one or more strings into a short hex cache key.
+
+    Args:
+        *parts: Strings that together identify the cached result
+
+    Returns:
+        32-character hex digest
+    """
+    h = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        h.update(part.encode('utf-8', 'surrogatepass'))
+        h.update(b'\0')
+    return h.hexdigest()
+
+
+class ContentCache:
+    """JSON-file cache stored under the user cache directory.
+
+    Each entry is one file named by its key, so concurrent readers and
+    writers never share a file; writes are atomic via rename. Expired
+    entries are deleted when read, and each bucket is pruned of expired
+    files once per process.
+    """
+
+    # Buckets already pruned in this process
+    _pruned_buckets: Set[str] = set()
+    _prune_lock = threading.Lock()
+
+    def __init__(self, bucket: str, ttl_seconds: int = DEFAULT_TTL_SECONDS):
+        """Initialize cache bucket.
+
+        Args:
+            bucket: Subdirectory name separating unrelated result types
+            ttl_seconds: Maximum age of an entry before it is ignored
+        """
+        self.cache_dir: Path = get_cache_dir() / bucket
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.ttl_seconds = ttl_seconds
+
+        with self._prune_lock:
+            first_use = bucket not in self._pruned_buckets
+            self._pruned_buckets.add(bucket)
+        if first_use:
+            self._prune_expired()
+
+    def _prune_expired(self) -> None:
+        """Delete entries and leftover temp files older than the TTL."""
+        cutoff = time.time() - self.ttl_seconds
+        removed = 0
+        try:
+            with os.scandir(self.cache_dir) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_file() and entry.stat().st_mtime < cutoff:
+                            os.unlink(entry.path)
+                            removed += 1
+                    except OSError:
+                        continue
+        except OSError as e:
+            logger.debug(f"Failed to prune cache bucket {self.cache_dir.name}: {e}")
+            return
+        if removed:
+            logger.debug(f"Pruned {removed} expired entries from cache bucket {self.cache_dir.name}")
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value for key, or None on miss or expiry."""
+        path = self.cache_dir / f"{key}.json"
+        try:
+            if time.time() - path.stat().st_mtime > self.ttl_seconds:
+                path.unlink(missing_ok=True)
+                return None
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.debug(f"Ignoring unreadable cache entry {path.name}: {e}")
+            return None
+
+    def put(self, key: str, value: Any) -> None:
+        """Store a JSON-serializable value under key (best effort)."""
+        path = self.cache_dir / f"{key}.json"
+        tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(value, f)
+            os.replace(tmp_path, path)
+        except (OSError, TypeError, ValueError) as e:
+            logger.debug(f"Failed to write cache entry {path.name}: {e}")
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
@@ -5,9 +5,43 @@ import json
 import re
 import logging
 
+import orjson
+
+# Decode through orjson; its JSONDecodeError subclasses json's
+_loads = orjson.loads
+_JSONErr = orjson.JSONDecodeError
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Single pattern for fix_json_issues: unquoted "line" ranges, or a run of
+# trailing commas before a closing brace/bracket. Consuming the whole run
+# keeps one pass idempotent (",,}" becomes "}", not ",}").
+_FIX_RE = re.compile(r'"line"\s*:\s*(\d+)\s*-\s*(\d+)|(?:,\s*)+([}\]])')
+
+# Fenced markdown block holding a JSON object, with or without a json tag
+_MD_JSON_RE = re.compile(r'```(?:json)?\s*(\{.*?\})\s*```', re.DOTALL)
+
+# Decoder used to parse an object starting at a given offset
+_DECODER = json.JSONDecoder()
+
+# Braces tracked by the raw_decode scan to find top-level object starts
+_BRACE_RE = re.compile(r'[{}]')
+
+
+def _fix_match(match: re.Match) -> str:
+    """Return the replacement for one _FIX_RE match."""
+    if match.group(1) is not None:
+        return f'"line": "{match.group(1)}-{match.group(2)}"'
+    return match.group(3)
+
+
+def _trunc(text: str, n: int = 1024) -> str:
+    """Keep the first and last n characters of text for error messages."""
+    if len(text) <= 2 * n:
+        return text
+    return f"{text[:n]}... [{len(text) - 2 * n} chars] ...{text[-n:]}"
+
 
 def fix_json_issues(text: str) -> str:
     """
@@ -20,12 +54,9 @@ def fix_json_issues(text: str) -> str:
         Fixed JSON text
     """
     # Fix line ranges like "line": 145-162 -> "line": "145-162"
-    # Match patterns like "line": 123-456 (number-number without quotes)
-    text = re.sub(r'"line"\s*:\s*(\d+)\s*-\s*(\d+)', r'"line": "\1-\2"', text)
-
-    # Fix trailing commas before closing braces/brackets
-    text = re.sub(r',\s*}', '}', text)
-    text = re.sub(r',\s*]', ']', text)
+    # and trailing commas before closing braces/brackets, in one
+    # idempotent pass
+    text = _FIX_RE.sub(_fix_match, text)
 
     return text
 
@@ -40,44 +71,62 @@ def extract_json_from_text(text):
     Returns:
         dict: Parsed JSON object if found, None otherwise
     """
-    # First, try to fix common issues
+    try:
+        # Clean responses parse directly, without any repair
+        parsed = _loads(text)
+        if isinstance(parsed, dict):
+            return parsed
+    except _JSONErr:
+        pass
+
+    # Then fix common issues; the repair is idempotent, so the candidates
+    # sliced out below need no second pass
     text = fix_json_issues(text)
 
     try:
-        # First, try to extract JSON from markdown code blocks (with or without language tag)
-        json_matches = [
-            re.search(r'```json\s*(.*?)\s*```', text, re.DOTALL),
-            re.search(r'```\s*(\{.*?\})\s*```', text, re.DOTALL)
-        ]
-
-        for json_match in json_matches:
-            if json_match:
-                try:
-                    json_text = fix_json_issues(json_match.group(1))
-                    return json.loads(json_text)
-                except json.JSONDecodeError:
-                    continue
-
-        # If no JSON found in code blocks, try to find JSON objects anywhere in the text
-        # Find all potential JSON objects (looking for balanced braces)
-        brace_count = 0
-        json_start = -1
-        for i, char in enumerate(text):
-            if char == '{':
-                if brace_count == 0:
-                    json_start = i
-                brace_count += 1
-            elif char == '}':
-                brace_count -= 1
-                if brace_count == 0 and json_start != -1:
-                    # Found a complete JSON object
-                    potential_json = text[json_start:i+1]
+        parsed = _loads(text)
+        if isinstance(parsed, dict):
+            return parsed
+    except _JSONErr:
+        pass
+
+    return _search_fixed_text(text)
+
+
+def _search_fixed_text(text):
+    """
+    Find the first JSON object embedded in already-repaired text.
+
+    Args:
+        text: Text that has been through fix_json_issues
+
+    Returns:
+        dict: Parsed JSON object if found, None otherwise
+    """
+    try:
+        # Try JSON from markdown code blocks (with or without language tag)
+        for json_match in _MD_JSON_RE.finditer(text):
+            try:
+                return _loads(json_match.group(1))
+            except _JSONErr:
+                continue
+
+        # If no JSON found in code blocks, try to find JSON objects anywhere in the text:
+        # decode from each top-level opening brace; raw_decode stops at the end of
+        # the object. Braces nested in a candidate that failed are skipped, so a
+        # truncated response never yields one of its inner objects.
+        depth = 0
+        for brace in _BRACE_RE.finditer(text):
+            if brace.group() == '{':
+                if depth == 0:
                     try:
-                        fixed_json = fix_json_issues(potential_json)
-                        return json.loads(fixed_json)
+                        return _DECODER.raw_decode(text, brace.start())[0]
                     except json.JSONDecodeError:
                         # This wasn't valid JSON, continue looking
-                        continue
+                        pass
+                depth += 1
+            elif depth > 0:
+                depth -= 1
     except Exception:
         pass
 
@@ -95,17 +144,24 @@ def parse_json_with_fallbacks(text, error_context=""):
     Returns:
         tuple: (success, result) where result is either the parsed JSON dict or error info
     """
-    # First, try to fix common issues
+    try:
+        # Fast path: well-formed responses parse without any repair
+        return True, _loads(text)
+    except _JSONErr:
+        pass
+
+    # Try again after fixing common issues
     fixed_text = fix_json_issues(text)
 
     try:
-        # First, try direct JSON parsing
-        return True, json.loads(fixed_text)
-    except json.JSONDecodeError:
+        # Direct JSON parsing of the repaired text
+        return True, _loads(fixed_text)
+    except _JSONErr:
         pass
 
-    # Try extracting JSON from text
-    extracted_json = extract_json_from_text(text)
+    # Try extracting JSON from the repaired text; both direct parses
+    # above already failed, so go straight to the search
+    extracted_json = _search_fixed_text(fixed_text)
     if extracted_json:
         return True, extracted_json
 
@@ -114,5 +170,63 @@ def parse_json_with_fallbacks(text, error_context=""):
     if error_context:
         error_msg = f"{error_context}: {error_msg}"
 
-    logger.error(f"{error_msg}. Raw output: {repr(text)}")
-    return False, {"error": f"Invalid JSON response -- raw output: {repr(text)}"}
\ No newline at end of file
+    raw_output = repr(_trunc(text))
+    logger.error(f"{error_msg}. Raw output: {raw_output}")
+    return False, {"error": f"Invalid JSON response -- raw output: {raw_output}"}
+
+
+class JSONObjectStreamDetector:
+    """Detect when streamed text contains a complete top-level JSON object.
+
+    Feed response chunks as they arrive; feed() returns True once a balanced
+    {...} object has been seen that parses as JSON, so callers can stop
+    reading trailing tokens.
+    """
+
+    def __init__(self):
+        self._parts = []
+        self._offset = 0  # Absolute position of the next character fed
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._start = -1
+
+    def feed(self, chunk: str) -> bool:
+        """Consume a chunk of streamed text.
+
+        Args:
+            chunk: Next piece of the response
+
+        Returns:
+            True if a complete JSON object has been received
+        """
+        self._parts.append(chunk)
+        base = self._offset
+        self._offset += len(chunk)
+
+        for i, char in enumerate(chunk):
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif char == '\\':
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"':
+                if self._depth > 0:
+                    self._in_string = True
+            elif char == '{':
+                if self._depth == 0:
+                    self._start = base + i
+                self._depth += 1
+            elif char == '}' and self._depth > 0:
+                self._depth -= 1
+                if self._depth == 0:
+                    candidate = "".join(self._parts)[self._start:base + i + 1]
+                    try:
+                        _loads(fix_json_issues(candidate))
+                        return True
+                    except _JSONErr:
+                        # Braces in surrounding prose; keep looking
+                        self._start = -1
+        return False
@@ -5,44 +5,43 @@ import sys
 import os
 
 
+def _build_prefix() -> str:
+    """Build the log prefix from repo and PR number in the environment."""
+    repo_name = os.environ.get('GITHUB_REPOSITORY', '')
+    pr_number = os.environ.get('PR_NUMBER', '')
+
+    if repo_name and pr_number:
+        return f"[{repo_name}#{pr_number}]"
+    elif repo_name:
+        return f"[{repo_name}]"
+    elif pr_number:
+        return f"[PR#{pr_number}]"
+    return ""
+
+
+# Formatter and stderr handler are shared by every logger from get_logger
+_PREFIX = _build_prefix()
+_FORMATTER = logging.Formatter(
+    f'{_PREFIX} [%(name)s] %(message)s' if _PREFIX else '[%(name)s] %(message)s'
+)
+_HANDLER = logging.StreamHandler(sys.stderr)
+_HANDLER.setFormatter(_FORMATTER)
+
+
 def get_logger(name: str) -> logging.Logger:
     """Get a configured logger that outputs to stderr.
-    
+
     Args:
         name: The name of the logger (usually __name__)
-        
+
     Returns:
         Configured logger instance
     """
     logger = logging.getLogger(name)
-    
+
     # Only configure if not already configured
     if not logger.handlers:
-        handler = logging.StreamHandler(sys.stderr)
-        
-        # Get repo and PR number from environment for prefix
-        repo_name = os.environ.get('GITHUB_REPOSITORY', '')
-        pr_number = os.environ.get('PR_NUMBER', '')
-        
-        # Build prefix
-        if repo_name and pr_number:
-            prefix = f"[{repo_name}#{pr_number}]"
-        elif repo_name:
-            prefix = f"[{repo_name}]"
-        elif pr_number:
-            prefix = f"[PR#{pr_number}]"
-        else:
-            prefix = ""
-        
-        # Include prefix in format if available
-        if prefix:
-            format_str = f'{prefix} [%(name)s] %(message)s'
-        else:
-            format_str = '[%(name)s] %(message)s'
-        
-        formatter = logging.Formatter(format_str)
-        handler.setFormatter(formatter)
-        logger.addHandler(handler)
+        logger.addHandler(_HANDLER)
         logger.setLevel(logging.INFO)
-    
-    return logger
\ No newline at end of file
+
+    return logger
@@ -7,19 +7,29 @@ In packaged mode, user data is stored in platform-specific user directories.
 
 import os
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
 # Application name for user directories
 APP_NAME = "DiffCOT"
 
+# Paths are fixed for the life of the process, so each getter is cached;
+# the directory tree is created in one batch when the user data dir is
+# first resolved, leaving the other getters as pure path computation.
 
+# Subdirectories of the user data dir created by _init_dirs
+_USER_SUBDIRS = ("reviews", "logs", "config", "cache")
+
+
+@lru_cache(maxsize=1)
 def is_packaged() -> bool:
     """Check if running as a packaged PyInstaller executable."""
     # PyInstaller sets sys.frozen when running as exe
     return getattr(sys, 'frozen', False)
 
 
+@lru_cache(maxsize=1)
 def get_app_root() -> Path:
     """Get the application root directory.
 
@@ -35,6 +45,30 @@ def get_app_root() -> Path:
         return Path(__file__).parent.parent
 
 
+def _compute_base_dir() -> Path:
+    """Resolve the platform-specific parent of the packaged user data dir."""
+    if sys.platform == "darwin":
+        # macOS
+        return Path.home() / "Library" / "Application Support"
+    elif sys.platform == "win32":
+        # Windows
+        appdata = os.environ.get("APPDATA")
+        if appdata:
+            return Path(appdata)
+        return Path.home() / "AppData" / "Roaming"
+    else:
+        # Linux and others
+        xdg_config = os.environ.get("XDG_CONFIG_HOME")
+        if xdg_config:
+            return Path(xdg_config)
+        return Path.home() / ".config"
+
+
+# Platform base directory, resolved once at import (packaged mode only)
+_BASE_DIR: Optional[Path] = _compute_base_dir() if is_packaged() else None
+
+
+@lru_cache(maxsize=1)
 def get_user_data_dir() -> Path:
     """Get the user data directory for storing databases, reviews, etc.
 
@@ -45,62 +79,54 @@ def get_user_data_dir() -> Path:
 
     In development mode, returns backend/data for convenience.
     """
-    if not is_packaged():
+    if _BASE_DIR is None:
         # Development mode: use local data directory
         data_dir = get_app_root() / "data"
-        data_dir.mkdir(parents=True, exist_ok=True)
-        return data_dir
-
-    # Packaged mode: use platform-specific user directory
-    if sys.platform == "darwin":
-        # macOS
-        base = Path.home() / "Library" / "Application Support"
-    elif sys.platform == "win32":
-        # Windows
-        appdata = os.environ.get("APPDATA")
-        if appdata:
-            base = Path(appdata)
-        else:
-            base = Path.home() / "AppData" / "Roaming"
     else:
-        # Linux and others
-        xdg_config = os.environ.get("XDG_CONFIG_HOME")
-        if xdg_config:
-            base = Path(xdg_config)
-        else:
-            base = Path.home() / ".config"
+        # Packaged mode: use platform-specific user directory
+        data_dir = _BASE_DIR / APP_NAME
+
+    _init_dirs(data_dir)
+    return data_dir
+
 
-    user_data_dir = base / APP_NAME
-    user_data_dir.mkdir(parents=True, exist_ok=True)
-    return user_data_dir
+def _init_dirs(base: Path) -> None:
+    """Create the user data directory and its standard subdirectories."""
+    for sub in _USER_SUBDIRS:
+        (base / sub).mkdir(parents=True, exist_ok=True)
 
 
+@lru_cache(maxsize=1)
 def get_database_path() -> Path:
     """Get the path for the SQLite database file."""
     return get_user_data_dir() / "conversations.db"
 
 
+@lru_cache(maxsize=1)
 def get_reviews_dir() -> Path:
     """Get the directory for storing review JSON files."""
-    reviews_dir = get_user_data_dir() / "reviews"
-    reviews_dir.mkdir(parents=True, exist_ok=True)
-    return reviews_dir
+    return get_user_data_dir() / "reviews"
 
 
+@lru_cache(maxsize=1)
 def get_logs_dir() -> Path:
     """Get the directory for log files."""
-    logs_dir = get_user_data_dir() / "logs"
-    logs_dir.mkdir(parents=True, exist_ok=True)
-    return logs_dir
+    return get_user_data_dir() / "logs"
 
 
+@lru_cache(maxsize=1)
 def get_config_dir() -> Path:
     """Get the directory for configuration files."""
-    config_dir = get_user_data_dir() / "config"
-    config_dir.mkdir(parents=True, exist_ok=True)
-    return config_dir
+    return get_user_data_dir() / "config"
 
 
+@lru_cache(maxsize=1)
+def get_cache_dir() -> Path:
+    """Get the directory for cached analysis results."""
+    return get_user_data_dir() / "cache"
+
+
+@lru_cache(maxsize=1)
 def get_bundled_resources_dir() -> Path:
     """Get the directory containing bundled resources (semgrep rules, etc.).
 
@@ -120,6 +146,7 @@ def get_bundled_resources_dir() -> Path:
 
 
 # Convenience exports for commonly used paths
+@lru_cache(maxsize=1)
 def get_semgrep_rules_path() -> Path:
     """Get the path to custom Semgrep rules."""
     return get_bundled_resources_dir() / "semgrep_rules" / "custom_rules.yaml"
@@ -138,6 +165,10 @@ def _log_paths():
     logger.debug(f"Reviews dir: {get_reviews_dir()}")
 
 
+# Packaged builds create the user directory tree up front
+if is_packaged():
+    get_user_data_dir()
+
 # Only log in debug mode
 if os.environ.get("DIFFCOT_DEBUG"):
     _log_paths()
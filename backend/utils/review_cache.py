@@ -0,0 +1,56 @@
+"""Disk cache for intent analysis results keyed by the prompts sent.
+
+Re-reviewing an unchanged PR (retries, reruns) reuses the intent analysis
+result instead of repeating the LLM call. SAST results are not stored
+here; Semgrep findings are cached per file together with the rules.
+"""
+
+from typing import Any, Dict, Optional
+
+from utils.content_cache import ContentCache, content_hash
+
+# Bump when the cached result shape changes (prompts are part of the key)
+CACHE_VERSION = "3"
+
+_cache: Optional[ContentCache] = None
+
+
+def _get_cache() -> ContentCache:
+    """Create the cache bucket on first use."""
+    global _cache
+    if _cache is None:
+        _cache = ContentCache("reviews")
+    return _cache
+
+
+def review_cache_key(
+    provider: str,
+    model: Optional[str],
+    system_prompt: str,
+    prompt: str
+) -> str:
+    """Build the cache key for one intent analysis request.
+
+    The key covers everything sent to the model, so edits to the PR title,
+    description, diff or related-file context all produce a new key.
+
+    Args:
+        provider: AI provider name
+        model: Model override, if any
+        system_prompt: System prompt sent with the request
+        prompt: User prompt sent with the request
+
+    Returns:
+        Hex cache key
+    """
+    return content_hash(CACHE_VERSION, provider.lower(), model or "", system_prompt, prompt)
+
+
+def get(key: str) -> Optional[Dict[str, Any]]:
+    """Return the cached intent analysis for key, or None on miss."""
+    return _get_cache().get(key)
+
+
+def put(key: str, result: Dict[str, Any]) -> None:
+    """Store an intent analysis under key (best effort)."""
+    _get_cache().put(key, result)